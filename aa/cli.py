@@ -1,27 +1,52 @@
 """Main CLI interface for aa tool."""
 
+import importlib
 import logging
+import os
+import sys
 import click
 
 from aa import __version__
-from aa.commands.init import init
-from aa.commands.validate import validate
-from aa.commands.test_id import test_id
-from aa.commands.cache_info import cache_info
-from aa.commands.list_tasks import list_tasks
-from aa.commands.scan import scan
-from aa.commands.update import update
-from aa.commands.reset import reset
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are invoked.
+
+    Subcommands are registered in ``lazy_subcommands`` as a mapping of
+    command name to ``"module.path:attribute"``.
+    """
+
+    lazy_subcommands: dict[str, str] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eagerly registered and lazy subcommand names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a subcommand, importing its module on first use."""
+        if cmd_name in self.lazy_subcommands:
+            module_path, attr_name = self.lazy_subcommands[cmd_name].split(':', 1)
+            module = importlib.import_module(module_path)
+            return getattr(module, attr_name)
+        return super().get_command(ctx, cmd_name)
+
+
+_logging_configured = False
 
 
 def setup_logging(verbose: int = 0) -> None:
     """Configure logging for the application.
     
+    Handlers are installed only on the first call; later calls just adjust
+    the root level.
+    
     Verbosity levels:
     - 0 (default): WARNING - only warnings, errors, and critical messages
     - 1 (-v): INFO - application logs
     - 2+ (-vv): DEBUG - detailed logs including HTTP requests
     """
+    global _logging_configured
+    
     if verbose == 0:
         level = logging.WARNING
     elif verbose == 1:
@@ -29,11 +54,15 @@ def setup_logging(verbose: int = 0) -> None:
     else:  # verbose >= 2
         level = logging.DEBUG
     
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if _logging_configured:
+        logging.getLogger().setLevel(level)
+    else:
+        logging.basicConfig(
+            level=level,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        _logging_configured = True
     
     # For verbose=1 (INFO), suppress noisy third-party loggers
     if verbose == 1:
@@ -42,7 +71,7 @@ def setup_logging(verbose: int = 0) -> None:
         logging.getLogger('asyncio').setLevel(logging.WARNING)
 
 
-@click.group(help=f"Asana Auto-ID tool for automatic task ID assignment (v{__version__})")
+@click.group(cls=LazyGroup, help=f"Asana Auto-ID tool for automatic task ID assignment (v{__version__})")
 @click.version_option(version=__version__)
 @click.option('--config', default='.aa.yml', help='Path to config file')
 @click.option('-v', '--verbose', count=True, help='Increase verbosity (-v for INFO, -vv for DEBUG)')
@@ -55,19 +84,58 @@ def cli(ctx: click.Context, config: str, verbose: int) -> None:
     ctx.obj['verbose'] = verbose
 
 
-# Register commands
-cli.add_command(init)
-cli.add_command(validate)
-cli.add_command(test_id)
-cli.add_command(cache_info)
-cli.add_command(list_tasks)
-cli.add_command(scan)
-cli.add_command(update)
-cli.add_command(reset)
+# Register commands (imported lazily on invocation)
+cli.lazy_subcommands = {
+    'init': 'aa.commands.init:init',
+    'validate': 'aa.commands.validate:validate',
+    'test-id': 'aa.commands.test_id:test_id',
+    'cache-info': 'aa.commands.cache_info:cache_info',
+    'list-tasks': 'aa.commands.list_tasks:list_tasks',
+    'scan': 'aa.commands.scan:scan',
+    'update': 'aa.commands.update:update',
+    'reset': 'aa.commands.reset:reset',
+}
+
+
+# Pre-rendered output of 'aa --help'; keep in sync with the group options
+# and the command docstrings above
+_STATIC_HELP = """\
+Usage: {prog} [OPTIONS] COMMAND [ARGS]...
+
+  Asana Auto-ID tool for automatic task ID assignment (v{version})
+
+Options:
+  --version      Show the version and exit.
+  --config TEXT  Path to config file
+  -v, --verbose  Increase verbosity (-v for INFO, -vv for DEBUG)
+  --help         Show this message and exit.
+
+Commands:
+  cache-info  Display cache information.
+  init        Initialize aa configuration file.
+  list-tasks  List all tasks from an Asana project.
+  reset       Remove IDs from all tasks in a project.
+  scan        Scan projects and update cache with existing IDs.
+  test-id     Test ID extraction from task name.
+  update      Assign IDs to tasks without them.
+  validate    Validate configuration file.
+"""
+
+
+def _program_name() -> str:
+    """Return the program name the way Click shows it in usage lines."""
+    name = os.path.basename(sys.argv[0])
+    if name == '__main__.py':
+        return 'python -m aa'
+    return name or 'aa'
 
 
 def main() -> None:
     """Entry point for the CLI."""
+    # Plain help requests don't need Click to build the command group
+    if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] in ('-h', '--help')):
+        sys.stdout.write(_STATIC_HELP.format(prog=_program_name(), version=__version__))
+        return
     cli(obj={})
 
 
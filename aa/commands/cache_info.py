@@ -1,12 +1,12 @@
 """Command to display cache information."""
 
 import logging
-from pathlib import Path
+import shutil
+import sys
 
 import click
-import yaml
 
-from aa.utils.cache_manager import DEFAULT_CACHE_FILE, load_cache
+from aa.utils.cache_manager import DEFAULT_CACHE_FILE, load_cache, resolve_cache_path
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +21,10 @@ logger = logging.getLogger(__name__)
 def cache_info(cache: str) -> None:
     """Display cache information.
     
-    Shows the contents of the .aa.cache.yaml file in a readable format.
+    Shows the contents of the .aa.cache.json file in a readable format.
     Displays last assigned IDs for root tasks and subtasks for each project.
     """
-    cache_file = Path(cache)
+    cache_file = resolve_cache_path(cache)
     
     if not cache_file.exists():
         click.echo(f"❌ Cache file not found: {cache}")
@@ -35,36 +35,40 @@ def cache_info(cache: str) -> None:
         # Load and validate cache
         cache_data = load_cache(cache)
         
-        click.echo(f"📦 Cache file: {cache}")
+        click.echo(f"📦 Cache file: {cache_file}")
         click.echo()
         
         if not cache_data.projects:
             click.echo("Cache is empty (no projects scanned yet)")
             return
         
-        # Display cache information for each project
+        # Collect cache information for each project and write it at once
+        lines: list[str] = []
         for project_code, project_cache in cache_data.projects.items():
-            click.echo(f"Project: {project_code}")
-            click.echo(f"  Last root ID: {project_code}-{project_cache.last_root}")
+            lines.append(f"Project: {project_code}")
+            lines.append(f"  Last root ID: {project_code}-{project_cache.last_root}")
             
             if project_cache.subtasks:
-                click.echo(f"  Subtasks:")
+                lines.append("  Subtasks:")
                 for parent_id, last_subtask in sorted(project_cache.subtasks.items()):
                     full_id = f"{project_code}-{parent_id}-{last_subtask}"
-                    click.echo(f"    {project_code}-{parent_id} → {full_id}")
+                    lines.append(f"    {project_code}-{parent_id} → {full_id}")
             else:
-                click.echo(f"  Subtasks: (none)")
+                lines.append("  Subtasks: (none)")
             
-            click.echo()
+            lines.append("")
         
-        # Also show raw YAML for reference
-        click.echo("Raw cache content:")
-        click.echo("─" * 50)
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            click.echo(content)
+        # Also show raw file content for reference
+        lines.append("Raw cache content:")
+        lines.append("─" * 50)
+        click.echo("\n".join(lines))
+        sys.stdout.flush()
+        with open(cache_file, 'rb') as f:
+            shutil.copyfileobj(f, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
         
     except Exception as e:
         click.echo(f"❌ Error reading cache: {e}", err=True)
-        logger.error(f"Error in cache-info command: {e}", exc_info=True)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Error in cache-info command: %s", e, exc_info=True)
         raise click.Abort()
@@ -1,88 +1,127 @@
 """Init command for creating configuration file."""
 
-import asyncio
 import logging
-import re
 from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Iterable, TypeVar
 import click
-import yaml
 
-from aa.core.asana_client import AsanaClient
-from aa.core.id_manager import ID_PATTERN
-from aa.models.config import Config, ProjectConfig
+if TYPE_CHECKING:
+    from aa.core.asana_client import AsanaClient
+    from aa.core.rate_limiter import RateLimiter
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-def create_template_config() -> Config:
-    """Create a template configuration using Pydantic models."""
-    return Config(
-        asana_token="YOUR_ASANA_PERSONAL_ACCESS_TOKEN",
-        interactive=False,
-        projects=[
-            ProjectConfig(code="PROJ", asana_id="1234567890123456"),
-            ProjectConfig(code="TASK", asana_id="9876543210987654"),
-        ],
-    )
+# How long fetched project listings are reused by later 'aa init' runs
+PROJECTS_CACHE_TTL = 600  # seconds
 
 
-async def detect_project_code(client: AsanaClient, project_id: str) -> str | None:
+# Template written by 'aa init --force'
+TEMPLATE_CONFIG = """\
+asana_token: YOUR_ASANA_PERSONAL_ACCESS_TOKEN
+interactive: false
+projects:
+  - code: PROJ
+    asana_id: '1234567890123456'
+  - code: TASK
+    asana_id: '9876543210987654'
+"""
+
+
+def pick_project_code(project_id: str, found_codes: set[str]) -> str | None:
+    """Return the single project code found in a project, if any.
+
+    Raises click.ClickException if multiple different project codes are found.
+    """
+    if len(found_codes) > 1:
+        codes_str = ", ".join(sorted(found_codes))
+        raise click.ClickException(
+            f"Multiple project codes found in project {project_id}: {codes_str}. "
+            "Please fix the task names or use 'aa reset' to clean up IDs."
+        )
+
+    if found_codes:
+        return next(iter(found_codes))
+
+    return None
+
+
+async def detect_project_code(client: "AsanaClient", project_id: str) -> str | None:
     """Detect project code from existing tasks.
 
     Fetches a sample of tasks and checks if they have IDs matching the pattern.
     Raises click.ClickException if multiple different project codes are found.
     """
+    from aa.core.id_manager import ID_RE
+
     try:
         # Fetch recent tasks (limit to 100 as requested)
         tasks = await client.get_project_tasks(project_id, limit=100)
 
-        found_codes = set()
-
-        for task in tasks:
-            name = task["name"]
-            match = re.match(ID_PATTERN, name)
-            if match:
-                found_codes.add(match.group(1))
-
-        if len(found_codes) > 1:
-            codes_str = ", ".join(sorted(found_codes))
-            raise click.ClickException(
-                f"Multiple project codes found in project {project_id}: {codes_str}. "
-                "Please fix the task names or use 'aa reset' to clean up IDs."
-            )
+        found_codes = {m.group(1) for t in tasks if (m := ID_RE.match(t["name"]))}
 
-        if found_codes:
-            return found_codes.pop()
+        return pick_project_code(project_id, found_codes)
 
     except click.ClickException:
         raise
     except Exception as e:
-        logger.warning(f"Failed to detect code for project {project_id}: {e}")
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Failed to detect code for project %s: %s", project_id, e)
 
     return None
 
 
+async def _bounded_gather(
+    coros: Iterable[Awaitable[T]], limit: int, limiter: "RateLimiter | None" = None
+) -> list[T]:
+    """Await coroutines concurrently with at most ``limit`` running at once.
+
+    Results are returned in the order of ``coros``. If a limiter is given,
+    each coroutine also waits for a rate-limit token before it starts.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _wrap(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+            return await coro
+
+    return await asyncio.gather(*(_wrap(c) for c in coros))
+
+
 async def fetch_all_projects(token: str) -> list[dict]:
     """Fetch all projects from all workspaces.
 
+    A complete listing (with detected codes) is cached for later init runs;
+    the truncated listing returned for workspaces with 100+ projects is not.
+
     Args:
         token: Asana Personal Access Token
 
     Returns:
         List of projects with gid and name
     """
+    import asyncio
+
+    from aa.core.asana_client import AsanaClient
+    from aa.core.rate_limiter import ASANA_REQUESTS_PER_MINUTE, RateLimiter
+
     client = AsanaClient(token)
 
     try:
         workspaces = await client.get_workspaces()
         click.echo(f"✓ Found {len(workspaces)} workspace(s)")
 
-        all_projects = []
-        for workspace in workspaces:
-            workspace_id = workspace["gid"]
-            projects = await client.get_projects(workspace_id)
-            all_projects.extend(projects)
+        # Fetch projects for all workspaces concurrently
+        project_lists = await asyncio.gather(
+            *(client.get_projects(w["gid"]) for w in workspaces)
+        )
+        all_projects = [p for projects in project_lists for p in projects]
 
         click.echo(f"✓ Found {len(all_projects)} project(s)")
 
@@ -96,82 +135,123 @@ async def fetch_all_projects(token: str) -> list[dict]:
             all_projects = all_projects[:1] if all_projects else []
             return all_projects
 
-        # Detect codes for all projects in parallel (with rate limiting)
         click.echo("Scanning projects for existing codes...")
 
-        # Limit concurrent requests to avoid rate limiting
-        semaphore = asyncio.Semaphore(5)  # Max 5 concurrent requests
-
-        async def process_project(project):
-            async with semaphore:
-                code = await detect_project_code(client, project["gid"])
-                if code:
-                    project["detected_code"] = code
-                # Small delay to avoid overwhelming the API
-                await asyncio.sleep(0.5)
-                return project
+        # Pace requests to Asana's rate limit; 429 responses are retried
+        # after Retry-After by the client
+        limiter = RateLimiter(ASANA_REQUESTS_PER_MINUTE, 60)
 
-        # Process all projects concurrently (but limited by semaphore)
-        tasks = [process_project(p) for p in all_projects]
-        all_projects = await asyncio.gather(*tasks)
+        # Detect project codes concurrently (bounded and paced)
+        codes = await _bounded_gather(
+            (detect_project_code(client, p["gid"]) for p in all_projects),
+            limit=5,
+            limiter=limiter,
+        )
+        for project, code in zip(all_projects, codes):
+            if code:
+                project["detected_code"] = code
 
         # Count how many codes were detected
         detected_count = sum(1 for p in all_projects if "detected_code" in p)
         if detected_count > 0:
             click.echo(f"✓ Detected existing codes for {detected_count} project(s)")
 
+        store_cached_projects(token, all_projects)
         return all_projects
 
     finally:
         await client.close()
 
 
+def _projects_cache_file(token: str) -> Path:
+    """Return the project listing cache file for a token."""
+    import hashlib
+
+    from aa.utils.user_cache import user_cache_dir
+
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+    return user_cache_dir("asana", f"{key}.json")
+
+
+def load_cached_projects(token: str) -> list[dict] | None:
+    """Return project listings cached by a recent init run, if still fresh.
+
+    Args:
+        token: Asana Personal Access Token the listing was fetched with
+
+    Returns:
+        Cached list of projects, or None if missing, stale or unreadable
+    """
+    import json
+    import os
+    import time
+
+    cache_file = _projects_cache_file(token)
+    try:
+        age = time.time() - os.stat(cache_file).st_mtime
+        if age >= PROJECTS_CACHE_TTL:
+            return None
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_projects(token: str, projects: list[dict]) -> None:
+    """Cache fetched project listings for later init runs.
+
+    The file is written atomically; failures are logged and ignored.
+
+    Args:
+        token: Asana Personal Access Token the listing was fetched with
+        projects: List of projects (with detected codes) to cache
+    """
+    import json
+    import os
+
+    cache_file = _projects_cache_file(token)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(projects, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug("Could not cache project listing: %s", e)
+        tmp_file.unlink(missing_ok=True)
+
+
 def write_config_with_comments(
     config_path: Path, token: str, projects: list[dict]
 ) -> None:
-    """Write config file with project URL comments using Pydantic models.
+    """Write config file with project URL comments.
 
     Args:
         config_path: Path to write the config file
         token: Asana token
         projects: List of projects from Asana API
     """
-    # Create ProjectConfig instances with placeholder codes
-    project_configs = [
-        ProjectConfig(
-            code=project.get("detected_code", "CODE"), asana_id=project["gid"]
-        )
-        for project in projects
-    ]
+    # Write config with comments
+    with open(config_path, "w", encoding="utf-8", buffering=64 * 1024) as f:
+        w = f.write
+        w(f"asana_token: {token!r}\n")
+        w("interactive: false\n")
+        w("projects:\n")
 
-    # Create Config instance
-    config = Config(asana_token=token, interactive=False, projects=project_configs)
+        for project in projects:
+            asana_id = project["gid"]
 
-    # Write config with comments
-    lines = []
-    lines.append(f"asana_token: {repr(config.asana_token)}")
-    lines.append(f"interactive: {str(config.interactive).lower()}")
-    lines.append("projects:")
-
-    for i, project in enumerate(projects):
-        asana_id = project["gid"]
-        project_name = project["name"]
-
-        # Add comment with project name and URL
-        lines.append(f"  # {project_name}")
-        lines.append(f"  # https://app.asana.com/0/{asana_id}")
-
-        detected_code = project.get("detected_code")
-        if detected_code:
-            lines.append(f"  - code: {detected_code}  # Detected from existing tasks")
-        else:
-            lines.append(
-                f"  - code: REPLACE_ME  # TODO: Replace with 2-5 letter code (uppercase)"
-            )
+            # Add comment with project name and URL
+            w(f"  # {project['name']}\n")
+            w(f"  # https://app.asana.com/0/{asana_id}\n")
 
-        lines.append(f"    asana_id: '{asana_id}'")
+            detected_code = project.get("detected_code")
+            if detected_code:
+                w(f"  - code: {detected_code}  # Detected from existing tasks\n")
+            else:
+                w("  - code: REPLACE_ME  # TODO: Replace with 2-5 letter code (uppercase)\n")
 
-    config_path.write_text("\n".join(lines) + "\n")
+            w(f"    asana_id: '{asana_id}'\n")
 
 
 @click.command()
@@ -179,6 +259,11 @@ def write_config_with_comments(
     "-f", "--force", is_flag=True, help="Create template without interactive setup"
 )
 @click.option("--config", default=".aa.yml", help="Path to config file")
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always fetch projects from Asana instead of reusing a recent listing",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -186,7 +271,9 @@ def write_config_with_comments(
     help="Increase verbosity (-v for INFO, -vv for DEBUG)",
 )
 @click.pass_context
-def init(ctx: click.Context, force: bool, config: str, verbose: int) -> None:
+def init(
+    ctx: click.Context, force: bool, config: str, no_cache: bool, verbose: int
+) -> None:
     """Initialize aa configuration file.
 
     By default, runs in interactive mode to prompt for your Asana token
@@ -212,13 +299,8 @@ def init(ctx: click.Context, force: bool, config: str, verbose: int) -> None:
 
     try:
         if force:
-            # Force mode: create template using Pydantic model
-            template_config = create_template_config()
-
-            # Convert to dict and write as YAML
-            config_dict = template_config.model_dump()
-            with open(config_file, "w") as f:
-                yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            # Force mode: write the static template
+            config_file.write_text(TEMPLATE_CONFIG, encoding="utf-8")
 
             logger.info(f"Created template configuration file: {config_path}")
             click.echo(f"✓ Created template configuration file: {config_path}")
@@ -243,9 +325,17 @@ def init(ctx: click.Context, force: bool, config: str, verbose: int) -> None:
 
             token = token.strip()
 
-            # Fetch all projects from Asana
-            click.echo("\n📡 Connecting to Asana...")
-            projects = asyncio.run(fetch_all_projects(token))
+            # Reuse the listing from a recent init run with the same token
+            projects = None if no_cache else load_cached_projects(token)
+            if projects is not None:
+                click.echo(f"\n✓ Using {len(projects)} project(s) cached from a recent run")
+                click.echo("   Use --no-cache to fetch them from Asana again")
+            else:
+                from aa.utils.runner import run_async
+
+                # Fetch all projects from Asana
+                click.echo("\n📡 Connecting to Asana...")
+                projects = run_async(fetch_all_projects(token))
 
             # Write config with comments
             write_config_with_comments(config_file, token, projects)
@@ -265,6 +355,7 @@ def init(ctx: click.Context, force: bool, config: str, verbose: int) -> None:
     except click.ClickException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create configuration file: {e}", exc_info=True)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Failed to create configuration file: %s", e, exc_info=True)
         click.echo(f"✗ Failed to create configuration file: {e}")
         ctx.exit(1)
@@ -1,11 +1,9 @@
 """Command to list tasks from an Asana project."""
 
-import asyncio
 import logging
 
 import click
 
-from aa.core.asana_client import AsanaClient
 from aa.utils.config_loader import load_config
 
 logger = logging.getLogger(__name__)
@@ -33,23 +31,23 @@ def list_tasks(project_id: str, config: str, debug: bool) -> None:
     It fetches all tasks from the specified project and displays them with their
     creation dates and subtask information.
     """
-    # Setup logging
-    log_level = logging.DEBUG if debug else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    # Logging is configured by the CLI group; only raise the level here
+    if debug:
+        logging.getLogger().setLevel(logging.DEBUG)
     
+    from aa.utils.runner import run_async
+
     try:
         # Load config to get the token
         cfg = load_config(config)
         
         # Run async operation
-        asyncio.run(_list_tasks_async(project_id, cfg.asana_token))
+        run_async(_list_tasks_async(project_id, cfg.asana_token))
         
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
-        logger.error(f"Error in list-tasks command: {e}", exc_info=True)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Error in list-tasks command: %s", e, exc_info=True)
         raise click.Abort()
 
 
@@ -60,6 +58,8 @@ async def _list_tasks_async(project_id: str, token: str) -> None:
         project_id: The Asana project GID
         token: Asana Personal Access Token
     """
+    from aa.core.asana_client import AsanaClient
+
     client = AsanaClient(token)
     
     try:
@@ -73,10 +73,9 @@ async def _list_tasks_async(project_id: str, token: str) -> None:
             click.echo("No tasks found in this project.")
             return
         
-        click.echo(f"Found {len(tasks)} tasks:")
-        click.echo("─" * 80)
+        lines: list[str] = [f"Found {len(tasks)} tasks:", "─" * 80]
         
-        # Display each task
+        # Format each task; output is written in a single call below
         for i, task in enumerate(tasks, 1):
             task_gid = task.get('gid', 'N/A')
             task_name = task.get('name', 'Unnamed')
@@ -84,23 +83,23 @@ async def _list_tasks_async(project_id: str, token: str) -> None:
             parent = task.get('parent')
             num_subtasks = task.get('num_subtasks', 0)
             
-            # Format output
-            click.echo(f"{i}. {task_name}")
-            click.echo(f"   GID: {task_gid}")
-            click.echo(f"   Created: {created_at}")
+            lines.append(f"{i}. {task_name}")
+            lines.append(f"   GID: {task_gid}")
+            lines.append(f"   Created: {created_at}")
             
             if parent:
                 parent_gid = parent.get('gid', 'N/A')
-                click.echo(f"   Parent: {parent_gid}")
+                lines.append(f"   Parent: {parent_gid}")
             
             # Show subtasks count if present
             if num_subtasks > 0:
-                click.echo(f"   Subtasks: {num_subtasks}")
+                lines.append(f"   Subtasks: {num_subtasks}")
             
-            click.echo()
+            lines.append("")
         
-        click.echo("─" * 80)
-        click.echo(f"✅ Total: {len(tasks)} tasks")
+        lines.append("─" * 80)
+        lines.append(f"✅ Total: {len(tasks)} tasks")
+        click.echo("\n".join(lines))
         
     finally:
         await client.close()
@@ -2,96 +2,179 @@
 
 import asyncio
 import logging
-import re
 import sys
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Optional
+
 import click
 
-from aa.core.asana_client import AsanaClient
-from aa.core.id_manager import ID_PATTERN
-from aa.utils.config_loader import load_config, ConfigurationError
+from aa.core.asana_client import BATCH_SIZE, AsanaClient
+from aa.core.id_manager import strip_id
+from aa.utils.config_loader import load_config
+from aa.utils.runner import run_async
 
 logger = logging.getLogger(__name__)
 
 
+# Number of planned renames shown before asking for confirmation
+PREVIEW_LIMIT = 20
+
+
+async def _iter_resets(
+    client: AsanaClient, project_id: str
+) -> AsyncIterator[tuple[str, str, str]]:
+    """Yield (gid, old name, new name) for each task in a project with an ID."""
+    async for task in client.iter_project_tasks(project_id):
+        name = task['name']
+        # Strip the ID and any following whitespace from the start
+        id_removed, new_name = strip_id(name)
+        if id_removed:
+            yield task['gid'], name, new_name
+
+
+async def _apply_resets(
+    client: AsanaClient,
+    resets: AsyncIterable[tuple[str, str, str]],
+    concurrency: int
+) -> tuple[int, int]:
+    """Rename tasks as resets arrive, BATCH_SIZE renames per batch request.
+    
+    Args:
+        client: Asana API client
+        resets: (gid, old name, new name) tuples
+        concurrency: Maximum number of concurrent batch requests
+        
+    Returns:
+        Tuple of (successfully renamed, attempted) task counts
+    """
+    # Concurrency is bounded to avoid pool exhaustion
+    semaphore = asyncio.Semaphore(concurrency)
+    total = 0
+    success_count = 0
+    done_count = 0
+    # The total is only known once every reset has arrived
+    scanning = True
+    
+    def report_progress():
+        if scanning:
+            status = f"{done_count} done (still scanning)"
+        else:
+            status = f"{done_count}/{total} done"
+        # Pad so a shorter status fully overwrites the previous one
+        click.echo(f"\r  {status:<32}", nl=False)
+    
+    async def update_chunk(chunk):
+        nonlocal success_count, done_count
+        # One batch request; rate-limited or failed actions are retried
+        # individually, the same way 'aa update' applies renames
+        async with semaphore:
+            responses = await client.update_task_names(chunk, concurrency=1)
+        
+        for (gid, _), response in zip(chunk, responses):
+            if isinstance(response, Exception):
+                logger.error("Failed to update task %s: %s", gid, response)
+            elif 200 <= response.get('status_code', 0) < 300:
+                success_count += 1
+            else:
+                logger.error(
+                    "Failed to update task %s: %s %s",
+                    gid, response.get('status_code'), response.get('body')
+                )
+        
+        # Report progress as batches finish
+        done_count += len(chunk)
+        report_progress()
+    
+    # The task group cancels outstanding batches if fetching fails or the
+    # run is interrupted
+    try:
+        async with asyncio.TaskGroup() as tg:
+            # Start each batch as soon as it is full
+            chunk = []
+            async for gid, _, new_name in resets:
+                chunk.append((gid, new_name))
+                total += 1
+                if len(chunk) == BATCH_SIZE:
+                    tg.create_task(update_chunk(chunk))
+                    chunk = []
+            if chunk:
+                tg.create_task(update_chunk(chunk))
+            scanning = False
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0] from None
+    
+    if total:
+        # The scan may have ended after the last batch reported
+        report_progress()
+        click.echo()
+    
+    return success_count, total
+
+
 async def reset_project(
     project_id: str,
     token: str,
     force: bool,
-    dry_run: bool
+    dry_run: bool,
+    concurrency: int = 8
 ) -> None:
     """Reset project by removing IDs from all tasks.
     
+    With --force (and without --dry-run) nothing is previewed, so renames
+    start while later pages of tasks are still being fetched.
+    
     Args:
         project_id: Asana Project GID
         token: Asana Personal Access Token
         force: Skip confirmation
         dry_run: Show changes without applying
+        concurrency: Maximum number of concurrent task updates
     """
     client = AsanaClient(token)
     
     try:
         click.echo(f"Fetching tasks for project {project_id}...")
-        tasks = await client.get_project_tasks(project_id)
-        
-        tasks_to_update = []
+        resets = _iter_resets(client, project_id)
         
-        for task in tasks:
-            name = task['name']
-            match = re.match(ID_PATTERN, name)
-            if match:
-                # Original name is the part after the ID
-                # ID_PATTERN matches "CODE-123 " or "CODE-123" at start
-                # We need to strip the ID and any following whitespace
-                
-                # Get the full match string
-                id_str = match.group(0)
-                new_name = name[len(id_str):].strip()
+        if not force or dry_run:
+            # Materialize the resets only when they have to be previewed
+            tasks_to_update = [item async for item in resets]
+            
+            if not tasks_to_update:
+                click.echo("✓ No tasks with IDs found.")
+                return
+            
+            # Preview changes
+            click.echo(f"\nFound {len(tasks_to_update)} tasks to reset:")
+            for _, old_name, new_name in islice(tasks_to_update, PREVIEW_LIMIT):
+                click.echo(f"  - {old_name} -> {new_name}")
+            if len(tasks_to_update) > PREVIEW_LIMIT:
+                click.echo(f"  ... and {len(tasks_to_update) - PREVIEW_LIMIT} more")
                 
-                # If name becomes empty (was just ID), keep it empty? 
-                # Or maybe we shouldn't touch it if it's just ID?
-                # Assuming we just strip the ID prefix.
+            if dry_run:
+                click.echo("\n[DRY RUN] No changes made.")
+                return
                 
-                tasks_to_update.append({
-                    'gid': task['gid'],
-                    'old_name': name,
-                    'new_name': new_name,
-                    'id_removed': match.group(1) + '-' + match.group(2)
-                })
-        
-        if not tasks_to_update:
-            click.echo("✓ No tasks with IDs found.")
-            return
-
-        # Preview changes
-        click.echo(f"\nFound {len(tasks_to_update)} tasks to reset:")
-        for item in tasks_to_update:
-            click.echo(f"  - {item['old_name']} -> {item['new_name']}")
+            if not force:
+                click.confirm(
+                    f"\nAre you sure you want to remove IDs from these {len(tasks_to_update)} tasks?",
+                    abort=True
+                )
             
-        if dry_run:
-            click.echo("\n[DRY RUN] No changes made.")
-            return
-            
-        if not force:
-            click.confirm(
-                f"\nAre you sure you want to remove IDs from these {len(tasks_to_update)} tasks?",
-                abort=True
-            )
+            async def replay():
+                for item in tasks_to_update:
+                    yield item
             
+            resets = replay()
+        
         click.echo("\nRemoving IDs...")
+        success_count, total = await _apply_resets(client, resets, concurrency)
         
-        # Process updates concurrently
-        async def update_task(item):
-            try:
-                await client.update_task_name(item['gid'], item['new_name'])
-                return True
-            except Exception as e:
-                logger.error(f"Failed to update task {item['gid']}: {e}")
-                return False
-                
-        results = await asyncio.gather(*[update_task(item) for item in tasks_to_update])
-        success_count = sum(1 for r in results if r)
+        if not total:
+            click.echo("✓ No tasks with IDs found.")
+            return
         
-        click.echo(f"✓ Successfully reset {success_count}/{len(tasks_to_update)} tasks.")
+        click.echo(f"✓ Successfully reset {success_count}/{total} tasks.")
         
     finally:
         await client.close()
@@ -103,7 +186,19 @@ async def reset_project(
 @click.option('--force', is_flag=True, help='Skip confirmation')
 @click.option('--dry-run', is_flag=True, help='Show changes without applying')
 @click.option('--debug', is_flag=True, help='Enable debug logging')
-def reset(project_id: str, config: str, force: bool, dry_run: bool, debug: bool) -> None:
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    help='Maximum concurrent Asana requests (default: max_concurrency from config)'
+)
+def reset(
+    project_id: str,
+    config: str,
+    force: bool,
+    dry_run: bool,
+    debug: bool,
+    concurrency: Optional[int]
+) -> None:
     """Remove IDs from all tasks in a project.
     
     Use this command to clean up a project that has incorrect or mixed IDs.
@@ -120,13 +215,17 @@ def reset(project_id: str, config: str, force: bool, dry_run: bool, debug: bool)
         try:
             config_obj = load_config(config)
             token = config_obj.asana_token
+            if concurrency is None:
+                concurrency = config_obj.max_concurrency
         except Exception:
             # Fallback: try to read token from env or prompt?
             # For now, stick to config file as primary source
             click.echo("Could not load token from config file.")
             token = click.prompt("Enter your Asana Personal Access Token", hide_input=True)
             
-        asyncio.run(reset_project(project_id, token, force, dry_run))
+        run_async(
+            reset_project(project_id, token, force, dry_run, concurrency or 8)
+        )
         
     except click.Abort:
         click.echo("\nAborted.")
@@ -2,26 +2,85 @@
 
 import asyncio
 import logging
-import signal
+import re
 import sys
+from contextlib import nullcontext
 from typing import Optional
 
 import click
 
 from aa.core.asana_client import AsanaClient
-from aa.core.id_manager import IDManager
+from aa.core.id_manager import ID_RE, IDManager
 from aa.models.config import Config
-from aa.utils.cache_manager import load_cache, save_cache
+from aa.utils.cache_manager import DEFAULT_CACHE_FILE, load_cache, save_cache
 from aa.utils.config_loader import load_config, ConfigurationError
+from aa.utils.interrupts import install_cache_saver
+from aa.utils.runner import run_async
 
 logger = logging.getLogger(__name__)
 
+# Subtask ID split into parent numeric part and subtask number:
+# "PRJ-5-2-3" -> ("5-2", "3"); root IDs like "PRJ-5" don't match
+_SUB_RE = re.compile(r'^[A-Z]{2,5}-(\d+(?:-\d+)*)-(\d+)$', re.ASCII)
+
 
 class ScanError(Exception):
     """Raised when scan operation encounters an error."""
     pass
 
 
+def _extract_ids(
+    tasks: list[dict],
+    project_code: str,
+    silent: bool = False
+) -> tuple[list[str], list[tuple[str, str]]]:
+    """Classify the IDs found in a page of task names.
+    
+    Plain (non-async) so it can run anywhere; it is called inline because a
+    page holds at most 100 tasks and regex matching holds the GIL, so
+    handing pages to a worker thread would only add overhead.
+    
+    Args:
+        tasks: Task dictionaries from one API page
+        project_code: The project code (e.g., "PRJ")
+        silent: If True, skip debug logging of found IDs
+        
+    Returns:
+        Tuple of (IDs of this project, (code, task name) pairs of foreign IDs)
+    """
+    existing_ids = []
+    foreign_ids = []
+    
+    for task in tasks:
+        task_name = task.get('name', '')
+        
+        # IDs start with an uppercase code; skip other names without the regex.
+        # (A project-code prefix check would also skip foreign IDs.)
+        if not task_name or not 'A' <= task_name[0] <= 'Z':
+            continue
+        
+        # One match per task; the captured code tells whether the ID
+        # belongs to this project or to another one
+        match = ID_RE.match(task_name)
+        if not match:
+            continue
+        
+        found_code = match.group(1)
+        if found_code == project_code:
+            task_id = f"{found_code}-{match.group(2)}"
+            existing_ids.append(task_id)
+            if not silent:
+                logger.debug("Found existing ID: %s in task %r", task_id, task_name)
+        else:
+            # Foreign ID: safety check to prevent overwriting IDs if config is wrong
+            foreign_ids.append((found_code, task_name))
+            logger.warning(
+                "Found foreign ID %s in task %r (expected %s)", found_code, task_name, project_code
+            )
+    
+    return existing_ids, foreign_ids
+
+
 async def scan_project(
     project_code: str,
     project_id: str,
@@ -48,37 +107,20 @@ async def scan_project(
     if not silent:
         logger.info(f"Scanning project {project_code} (ID: {project_id})")
     
-    # Get all tasks from project
-    tasks = await asana_client.get_project_tasks(project_id)
-    if not silent:
-        logger.info(f"Found {len(tasks)} tasks in project {project_code}")
-    
-    # Extract existing IDs from task names
+    # Extract existing IDs from task names as pages arrive
+    total_tasks = 0
     existing_ids = []
     foreign_ids = []
     
-    for task in tasks:
-        task_name = task.get('name', '')
-        
-        # Check for ID matching current project
-        task_id = id_manager.extract_id(task_name, project_code)
-        if task_id:
-            existing_ids.append(task_id)
-            if not silent:
-                logger.debug(f"Found existing ID: {task_id} in task '{task_name}'")
-            continue
-            
-        # Check for IDs from OTHER projects (foreign IDs)
-        # This is a safety check to prevent overwriting IDs if config is wrong
-        import re
-        from aa.core.id_manager import ID_PATTERN
-        match = re.match(ID_PATTERN, task_name)
-        if match:
-            found_code = match.group(1)
-            if found_code != project_code:
-                foreign_ids.append((found_code, task_name))
-                logger.warning(f"Found foreign ID {found_code} in task '{task_name}' (expected {project_code})")
+    async for page in asana_client.iter_project_task_pages(project_id):
+        total_tasks += len(page)
+        page_ids, page_foreign = _extract_ids(page, project_code, silent)
+        existing_ids.extend(page_ids)
+        foreign_ids.extend(page_foreign)
 
+    if not silent:
+        logger.info(f"Found {total_tasks} tasks in project {project_code}")
+    
     if foreign_ids:
         error_msg = f"Found {len(foreign_ids)} tasks with IDs from other projects (e.g. {foreign_ids[0][0]}).\n"
         error_msg += f"Expected project code: {project_code}\n"
@@ -106,18 +148,19 @@ async def scan_project(
             
             # Update subtask counters
             for task_id in existing_ids:
-                # Extract numeric part
-                numeric_part = task_id.replace(f"{project_code}-", "", 1)
-                if '-' in numeric_part:
+                match = _SUB_RE.match(task_id)
+                if match:
                     # This is a subtask
-                    parts = numeric_part.rsplit('-', 1)
-                    parent_numeric = parts[0]
-                    subtask_number = int(parts[1])
+                    parent_numeric = match.group(1)
+                    subtask_number = int(match.group(2))
                     
                     current_max = id_manager.cache_data.projects[project_code].subtasks.get(parent_numeric, 0)
                     if subtask_number > current_max:
                         id_manager.cache_data.projects[project_code].subtasks[parent_numeric] = subtask_number
-                        logger.debug(f"Updated subtask counter for {project_code}-{parent_numeric} to {subtask_number}")
+                        logger.debug(
+                            "Updated subtask counter for %s-%s to %d",
+                            project_code, parent_numeric, subtask_number
+                        )
         else:
             # Raise error with all conflicts
             error_msg = f"Conflicts detected in project {project_code}:\n"
@@ -144,7 +187,7 @@ async def scan_project(
     
     return {
         'project_code': project_code,
-        'total_tasks': len(tasks),
+        'total_tasks': total_tasks,
         'tasks_with_ids': len(existing_ids),
         'conflicts': conflicts
     }
@@ -154,7 +197,9 @@ async def scan_projects_async(
     config: Config,
     project_code: Optional[str],
     ignore_conflicts: bool,
-    silent: bool = False
+    silent: bool = False,
+    asana_client: Optional[AsanaClient] = None,
+    id_manager: Optional[IDManager] = None
 ) -> None:
     """Async implementation of project scanning.
     
@@ -162,94 +207,112 @@ async def scan_projects_async(
         config: Configuration object
         project_code: Optional specific project to scan
         ignore_conflicts: Whether to ignore ID conflicts
+        asana_client: Optional client to reuse; the caller then owns the
+            client
+        id_manager: Optional ID manager to update in place; the caller then
+            owns saving the cache, including on interruption
         
     Raises:
         ScanError: If scan fails
     """
-    # Load cache
-    cache = load_cache()
-    id_manager = IDManager(cache)
-    
-    # Setup signal handler to save cache on interruption
-    interrupted = False
+    owns_cache = id_manager is None
+    if owns_cache:
+        # Load cache
+        cache = load_cache()
+        id_manager = IDManager(cache)
     
-    def signal_handler(signum, frame):
-        nonlocal interrupted
-        interrupted = True
-        logger.warning("\nReceived interrupt signal, saving cache...")
-        try:
-            save_cache(id_manager.cache_data)
-            if not silent:
-                click.echo("\n✓ Cache saved before exit")
-        except Exception as e:
-            logger.error(f"Failed to save cache on interrupt: {e}")
-        raise KeyboardInterrupt()
+    owns_client = asana_client is None
+    if owns_client:
+        # Create Asana client
+        asana_client = AsanaClient(config.asana_token)
     
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Save the cache on interruption unless the caller owns it
+    cache_saver = (
+        install_cache_saver(lambda: id_manager.cache_data, silent)
+        if owns_cache else nullcontext()
+    )
     
-    # Create Asana client
-    asana_client = AsanaClient(config.asana_token)
-    
-    try:
-        # Determine which projects to scan
-        if project_code:
-            # Scan specific project
-            project_config = next(
-                (p for p in config.projects if p.code == project_code),
-                None
-            )
-            if not project_config:
-                raise ScanError(f"Project '{project_code}' not found in configuration")
+    with cache_saver:
+        try:
+            # Determine which projects to scan
+            if project_code:
+                # Scan specific project
+                project_config = config.projects_by_code.get(project_code)
+                if not project_config:
+                    raise ScanError(f"Project '{project_code}' not found in configuration")
             
-            projects_to_scan = [project_config]
-        else:
-            # Scan all projects
-            projects_to_scan = config.projects
+                projects_to_scan = [project_config]
+            else:
+                # Scan all projects
+                projects_to_scan = config.projects
+        
+            if not silent:
+                logger.info(f"Scanning {len(projects_to_scan)} project(s)")
         
-        if not silent:
-            logger.info(f"Scanning {len(projects_to_scan)} project(s)")
+            async def scan_one(project):
+                """Scan a single project, wrapping unexpected errors in ScanError."""
+                try:
+                    return await scan_project(
+                        project.code,
+                        project.asana_id,
+                        asana_client,
+                        id_manager,
+                        ignore_conflicts,
+                        silent
+                    )
+                except ScanError:
+                    # Re-raise scan errors (conflicts, etc.)
+                    raise
+                except Exception as e:
+                    logger.error(f"Error scanning project {project.code}: {e}")
+                    raise ScanError(f"Failed to scan project {project.code}: {e}")
         
-        # Scan each project
-        results = []
-        for project in projects_to_scan:
+            # Scan all projects concurrently and report each one as it finishes.
+            # scan_project only touches the cache after its last await (the task
+            # fetch), so the shared id_manager needs no locking.
+            tasks = [asyncio.create_task(scan_one(project)) for project in projects_to_scan]
+        
+            results_by_code = {}
             try:
-                result = await scan_project(
-                    project.code,
-                    project.asana_id,
-                    asana_client,
-                    id_manager,
-                    ignore_conflicts,
-                    silent
-                )
-                results.append(result)
-            except ScanError:
-                # Re-raise scan errors (conflicts, etc.)
-                raise
-            except Exception as e:
-                logger.error(f"Error scanning project {project.code}: {e}")
-                raise ScanError(f"Failed to scan project {project.code}: {e}")
+                for done in asyncio.as_completed(tasks):
+                    result = await done
+                    results_by_code[result['project_code']] = result
+                    if not silent:
+                        click.echo(
+                            f"✓ Scanned {result['project_code']} "
+                            f"({len(results_by_code)}/{len(tasks)})"
+                        )
+            finally:
+                # Cancel outstanding scans if one of them failed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        
+            # Keep the summary in configuration order
+            results = [results_by_code[p.code] for p in projects_to_scan]
         
-        # Save updated cache
-        save_cache(id_manager.cache_data)
-        if not silent:
-            logger.info("Cache updated successfully")
+            # Save updated cache
+            if owns_cache:
+                save_cache(id_manager.cache_data)
+                if not silent:
+                    logger.info("Cache updated successfully")
         
-        # Print summary (skip in silent mode)
-        if not silent:
-            click.echo("\n=== Scan Summary ===")
-            for result in results:
-                click.echo(f"\nProject: {result['project_code']}")
-                click.echo(f"  Total tasks: {result['total_tasks']}")
-                click.echo(f"  Tasks with IDs: {result['tasks_with_ids']}")
-                if result['conflicts']:
-                    click.echo(f"  Conflicts: {len(result['conflicts'])} (resolved with --ignore-conflicts)")
+            # Print summary (skip in silent mode)
+            if not silent:
+                click.echo("\n=== Scan Summary ===")
+                for result in results:
+                    click.echo(f"\nProject: {result['project_code']}")
+                    click.echo(f"  Total tasks: {result['total_tasks']}")
+                    click.echo(f"  Tasks with IDs: {result['tasks_with_ids']}")
+                    if result['conflicts']:
+                        click.echo(f"  Conflicts: {len(result['conflicts'])} (resolved with --ignore-conflicts)")
             
-            click.echo(f"\n✓ Cache saved to .aa.cache.yaml")
+                if owns_cache:
+                    click.echo(f"\n✓ Cache saved to {DEFAULT_CACHE_FILE}")
         
-    finally:
-        await asana_client.close()
+        finally:
+            if owns_client:
+                await asana_client.close()
 
 
 @click.command()
@@ -266,7 +329,7 @@ def scan(config: str, project: Optional[str], verbose: int, ignore_conflicts: bo
     - Extracts existing IDs from task names
     - Detects conflicts (IDs greater than cache, duplicates)
     - Updates cache with found IDs
-    - Saves cache to .aa.cache.yaml
+    - Saves cache to .aa.cache.json
     
     Examples:
         aa scan                    # Scan all projects
@@ -290,7 +353,7 @@ def scan(config: str, project: Optional[str], verbose: int, ignore_conflicts: bo
         config_obj = load_config(config)
         
         # Run async scan
-        asyncio.run(scan_projects_async(config_obj, project, ignore_conflicts))
+        run_async(scan_projects_async(config_obj, project, ignore_conflicts))
         
     except ConfigurationError as e:
         click.echo(f"Configuration error: {e}", err=True)
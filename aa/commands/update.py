@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-import signal
 import sys
 from typing import Optional
 
@@ -12,8 +11,10 @@ from aa.core.asana_client import AsanaClient
 from aa.core.id_manager import IDManager
 from aa.core.task_processor import TaskProcessor
 from aa.models.config import Config
-from aa.utils.cache_manager import load_cache, save_cache
+from aa.utils.cache_manager import DEFAULT_CACHE_FILE, load_cache, save_cache
 from aa.utils.config_loader import load_config, ConfigurationError
+from aa.utils.interrupts import install_cache_saver
+from aa.utils.runner import run_async
 from aa.commands.scan import scan_projects_async, ScanError
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,7 @@ async def update_projects_async(
     dry_run: bool,
     ignore_conflicts: bool,
     verbose: bool = False,
+    concurrency: Optional[int] = None,
 ) -> None:
     """Async implementation of project update.
 
@@ -40,149 +42,148 @@ async def update_projects_async(
         dry_run: If True, show changes without applying them
         ignore_conflicts: Whether to ignore ID conflicts during scan
         verbose: If True, show all update details without limit
+        concurrency: Maximum concurrent Asana requests (default: from config)
 
     Raises:
         UpdateError: If update fails
     """
-    # First, run scan to check for conflicts and update cache
-    # In dry-run mode, run scan silently to avoid cluttering output
-    if not dry_run:
-        logger.info("Running scan to check for conflicts...")
-    try:
-        await scan_projects_async(
-            config, project_code, ignore_conflicts, silent=dry_run
-        )
-    except ScanError as e:
-        raise UpdateError(f"Scan failed: {e}")
-
-    # Load cache (refreshed by scan)
+    # Load cache once; the scan phase updates it in place. The loaded object
+    # is private to this run and dry-run never saves it, so previews can
+    # mutate it freely without touching the cache file.
     cache = load_cache()
-
-    # In dry-run mode, work with a copy of cache so we can preview without affecting the real cache
-    if dry_run:
-        import copy
-
-        cache = copy.deepcopy(cache)
-
     id_manager = IDManager(cache)
 
-    # Setup signal handler to save cache on interruption
-    interrupted = False
-
-    def signal_handler(signum, frame):
-        nonlocal interrupted
-        interrupted = True
-        logger.warning("\nReceived interrupt signal, saving cache...")
-        if not dry_run:
+    # Bound concurrent Asana requests to avoid pool exhaustion and rate limits
+    max_concurrency = concurrency or config.max_concurrency
+
+    # Save the cache on interruption (never in dry-run), once for both the
+    # scan and update phases
+    with install_cache_saver(lambda: None if dry_run else id_manager.cache_data):
+        # Share one client (and its connection pool) between scan and update
+        async with AsanaClient(
+            config.asana_token, max_concurrency=max_concurrency
+        ) as asana_client:
+            # First, run scan to check for conflicts and update cache
+            # In dry-run mode, run scan silently to avoid cluttering output
+            if not dry_run:
+                logger.info("Running scan to check for conflicts...")
             try:
-                save_cache(id_manager.cache_data)
-                click.echo("\n✓ Cache saved before exit")
-            except Exception as e:
-                logger.error(f"Failed to save cache on interrupt: {e}")
-        raise KeyboardInterrupt()
-
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
-    # Create Asana client
-    asana_client = AsanaClient(config.asana_token)
-
-    try:
-        # Determine which projects to update
-        if project_code:
-            # Update specific project
-            project_config = next(
-                (p for p in config.projects if p.code == project_code), None
-            )
-            if not project_config:
-                raise UpdateError(
-                    f"Project '{project_code}' not found in configuration"
+                await scan_projects_async(
+                    config,
+                    project_code,
+                    ignore_conflicts,
+                    silent=dry_run,
+                    asana_client=asana_client,
+                    id_manager=id_manager,
                 )
+            except ScanError as e:
+                raise UpdateError(f"Scan failed: {e}")
+
+            # Determine which projects to update
+            if project_code:
+                # Update specific project
+                project_config = config.projects_by_code.get(project_code)
+                if not project_config:
+                    raise UpdateError(
+                        f"Project '{project_code}' not found in configuration"
+                    )
+
+                projects_to_update = [project_config]
+            else:
+                # Update all projects
+                projects_to_update = config.projects
+
+            logger.info(
+                f"{'[DRY-RUN] ' if dry_run else ''}Updating {len(projects_to_update)} project(s)"
+            )
 
-            projects_to_update = [project_config]
-        else:
-            # Update all projects
-            projects_to_update = config.projects
-
-        logger.info(
-            f"{'[DRY-RUN] ' if dry_run else ''}Updating {len(projects_to_update)} project(s)"
-        )
+            if dry_run:
+                click.echo("\n=== DRY-RUN MODE ===")
+                click.echo("No changes will be made to Asana or cache\n")
 
-        if dry_run:
-            click.echo("\n=== DRY-RUN MODE ===")
-            click.echo("No changes will be made to Asana or cache\n")
+            semaphore = asyncio.Semaphore(max_concurrency)
 
-        # Create task processor
-        task_processor = TaskProcessor(asana_client, id_manager)
+            # Create task processor
+            task_processor = TaskProcessor(
+                asana_client, id_manager, max_concurrency=max_concurrency
+            )
 
-        # Process projects in parallel using asyncio.gather()
-        logger.info(f"Processing {len(projects_to_update)} project(s) in parallel")
+            # Process projects in parallel in a task group
+            logger.info(
+                f"Processing {len(projects_to_update)} project(s) in parallel "
+                f"(max {max_concurrency} concurrent)"
+            )
 
-        async def process_single_project(project):
-            """Process a single project and handle errors."""
+            async def process_single_project(project):
+                """Process a single project and handle errors."""
+                try:
+                    async with semaphore:
+                        return await task_processor.process_project(
+                            project.asana_id, project.code, dry_run=dry_run
+                        )
+                except Exception as e:
+                    logger.error(f"Error updating project {project.code}: {e}")
+                    raise UpdateError(f"Failed to update project {project.code}: {e}")
+
+            # Process all projects concurrently; the first failure cancels
+            # the projects still in flight
             try:
-                return await task_processor.process_project(
-                    project.asana_id, project.code, dry_run=dry_run
-                )
-            except Exception as e:
-                logger.error(f"Error updating project {project.code}: {e}")
-                raise UpdateError(f"Failed to update project {project.code}: {e}")
-
-        # Process all projects concurrently
-        results = await asyncio.gather(
-            *[process_single_project(project) for project in projects_to_update]
-        )
-
-        # Save updated cache (unless dry-run)
-        if not dry_run:
-            save_cache(id_manager.cache_data)
-            logger.info("Cache updated successfully")
-
-        # Print summary
-        click.echo("\n=== Update Summary ===")
-        for result in results:
-            click.echo(f"\nProject: {result.project_code}")
-            click.echo(f"  Total tasks processed: {result.total_processed}")
-            click.echo(f"  Tasks updated: {len(result.updates)}")
-            click.echo(f"  Tasks skipped (already have ID): {result.skipped}")
-
-            if result.errors:
-                click.echo(f"  Errors: {len(result.errors)}")
-                for error in result.errors:
-                    click.echo(f"    - {error}")
-
-            # Show update details
-            if result.updates:
-                # Determine how many updates to show
-                if verbose:
-                    # Show all updates in verbose mode
-                    display_count = len(result.updates)
-                else:
-                    # Show first 10 by default
-                    display_count = min(10, len(result.updates))
-
-                if dry_run:
-                    click.echo(f"\n  IDs that would be assigned:")
-                else:
-                    click.echo(f"\n  Updated tasks:")
-
-                for update in result.updates[:display_count]:
-                    click.echo(f"    {update.assigned_id}: {update.old_name}")
-
-                if len(result.updates) > display_count:
-                    remaining = len(result.updates) - display_count
-                    click.echo(f"    ... and {remaining} more (use -v to see all)")
-
-        if dry_run:
-            click.echo(f"\n✓ Dry-run complete. No changes were made.")
-            click.echo(f"  Run without --dry-run to apply these changes.")
-        else:
-            click.echo(f"\n✓ Tasks updated successfully")
-            click.echo(f"✓ Cache saved to .aa.cache.yaml")
-
-    finally:
-        await asana_client.close()
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(process_single_project(project))
+                        for project in projects_to_update
+                    ]
+            except ExceptionGroup as eg:
+                # Surface the first UpdateError rather than the group
+                raise eg.exceptions[0] from None
+            results = [task.result() for task in tasks]
+
+            # Save updated cache (unless dry-run)
+            if not dry_run:
+                save_cache(id_manager.cache_data)
+                logger.info("Cache updated successfully")
+
+            # Print summary
+            click.echo("\n=== Update Summary ===")
+            for result in results:
+                click.echo(f"\nProject: {result.project_code}")
+                click.echo(f"  Total tasks processed: {result.total_processed}")
+                click.echo(f"  Tasks updated: {len(result.updates)}")
+                click.echo(f"  Tasks skipped (already have ID): {result.skipped}")
+
+                if result.errors:
+                    click.echo(f"  Errors: {len(result.errors)}")
+                    for error in result.errors:
+                        click.echo(f"    - {error}")
+
+                # Show update details
+                if result.updates:
+                    # Determine how many updates to show
+                    if verbose:
+                        # Show all updates in verbose mode
+                        display_count = len(result.updates)
+                    else:
+                        # Show first 10 by default
+                        display_count = min(10, len(result.updates))
+
+                    if dry_run:
+                        click.echo(f"\n  IDs that would be assigned:")
+                    else:
+                        click.echo(f"\n  Updated tasks:")
+
+                    for update in result.updates[:display_count]:
+                        click.echo(f"    {update.assigned_id}: {update.old_name}")
+
+                    if len(result.updates) > display_count:
+                        remaining = len(result.updates) - display_count
+                        click.echo(f"    ... and {remaining} more (use -v to see all)")
+
+            if dry_run:
+                click.echo(f"\n✓ Dry-run complete. No changes were made.")
+                click.echo(f"  Run without --dry-run to apply these changes.")
+            else:
+                click.echo(f"\n✓ Tasks updated successfully")
+                click.echo(f"✓ Cache saved to {DEFAULT_CACHE_FILE}")
 
 
 @click.command()
@@ -198,12 +199,18 @@ async def update_projects_async(
 @click.option(
     "--ignore-conflicts", is_flag=True, help="Ignore ID conflicts during scan"
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    help="Maximum concurrent Asana requests (default: max_concurrency from config)",
+)
 def update(
     config: str,
     project: Optional[str],
     dry_run: bool,
     verbose: int,
     ignore_conflicts: bool,
+    concurrency: Optional[int],
 ) -> None:
     """Assign IDs to tasks without them.
 
@@ -239,9 +246,14 @@ def update(
         config_obj = load_config(config)
 
         # Run async update
-        asyncio.run(
+        run_async(
             update_projects_async(
-                config_obj, project, dry_run, ignore_conflicts, verbose=verbose > 0
+                config_obj,
+                project,
+                dry_run,
+                ignore_conflicts,
+                verbose=verbose > 0,
+                concurrency=concurrency,
             )
         )
 
@@ -1,6 +1,18 @@
 """Core business logic for aa tool."""
 
-from aa.core.asana_client import AsanaClient
-from aa.core.id_manager import IDManager
+import importlib
 
 __all__ = ['AsanaClient', 'IDManager']
+
+# Re-exports are resolved on first access so that importing a light submodule
+# (e.g. aa.core.id_manager) does not pull in httpx via the Asana client.
+_LAZY_EXPORTS = {
+    'AsanaClient': 'aa.core.asana_client',
+    'IDManager': 'aa.core.id_manager',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
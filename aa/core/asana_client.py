@@ -1,50 +1,163 @@
 """Asana API client for async operations."""
 
 import asyncio
+import importlib.util
 import logging
-from typing import Any
+import random
+import time
+from operator import itemgetter
+from typing import Any, AsyncIterator, Awaitable, Callable
 import httpx
 
+from aa.utils import json_fast
+
+__all__ = ["AsanaClient", "BATCH_SIZE", "HTTP2_AVAILABLE"]
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of actions Asana accepts in a single /batch request
+BATCH_SIZE = 10
+
+# Retry backoff ("full jitter"): sleep a random time in
+# [0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)] seconds
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+# Methods that can be repeated without changing the outcome; other methods
+# are not retried after the server may have seen them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# How long workspace/project listings are reused before being re-fetched
+METADATA_CACHE_TTL = 300.0
+
+# HTTP/2 needs the optional 'h2' package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# The only task fields aa reads; everything else Asana would return by default
+# (notes, assignee, custom fields, ...) is left out of list responses
+TASK_FIELDS = ("gid", "name", "created_at", "parent.gid", "num_subtasks")
+TASK_OPT_FIELDS = ",".join(TASK_FIELDS)
+
+# Sort key for API items; created_at is always requested in opt_fields.
+# The project/subtask list endpoints have no server-side sort_by option.
+_BY_CREATED_AT = itemgetter("created_at")
+
+# Compressed encodings httpx can decode; brotli needs an optional package
+BROTLI_AVAILABLE = any(
+    importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi")
+)
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
 
 class AsanaClient:
-    """Async client for Asana API operations."""
+    """Async client for Asana API operations.
 
-    def __init__(self, token: str):
+    The underlying connection pool is bound to the event loop it is first
+    used on, so create one client per ``asyncio.run`` and share it between
+    the tasks of that loop (``async with AsanaClient(token) as client``).
+    """
+
+    def __init__(self, token: str, max_concurrency: int = 32):
         """Initialize the Asana client.
 
+        Uses HTTP/2 when the optional 'h2' package is installed, so
+        concurrent requests share a single connection; otherwise falls
+        back to HTTP/1.1 with a keep-alive pool. The pool holds one
+        connection per request slot, since no more are ever in use.
+
         Args:
             token: Asana Personal Access Token
+            max_concurrency: Maximum number of requests in flight at once
         """
         self.token = token
+        self._inflight = asyncio.BoundedSemaphore(max_concurrency)
+        # Asana rate-limits per token, so a Retry-After seen by one request
+        # pauses every request made through this client until the deadline
+        self._rate_limit_until = 0.0
+        self._rate_limit_lock = asyncio.Lock()
+        # Workspace and project listings, keyed by endpoint: (fetched_at, data)
+        self._metadata_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        self._metadata_locks: dict[str, asyncio.Lock] = {}
         self.client = httpx.AsyncClient(
             base_url="https://app.asana.com/api/1.0",
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=30.0,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/json",
+                "Accept-Encoding": ACCEPT_ENCODING,
+            },
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=max_concurrency,
+                    max_keepalive_connections=max_concurrency,
+                    keepalive_expiry=60.0,
+                ),
+                retries=1,
+            ),
         )
 
+    async def _cached_listing(
+        self, key: str, fetch: Callable[[], Awaitable[list[dict[str, Any]]]]
+    ) -> list[dict[str, Any]]:
+        """Return a listing from the metadata cache, fetching it on a miss.
+
+        Concurrent misses for the same key wait on a per-key lock, so only
+        one request is made.
+
+        Args:
+            key: Cache key (one per endpoint and arguments)
+            fetch: Coroutine function performing the actual request
+
+        Returns:
+            A fresh list with the cached items
+        """
+        lock = self._metadata_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._metadata_cache.get(key)
+            if entry is None or time.monotonic() - entry[0] >= METADATA_CACHE_TTL:
+                entry = (time.monotonic(), await fetch())
+                self._metadata_cache[key] = entry
+            else:
+                logger.debug("Using cached %s", key)
+        return list(entry[1])
+
+    def invalidate(self) -> None:
+        """Drop cached workspace and project listings.
+
+        Call after changing workspaces or projects so the next lookup
+        re-fetches them.
+        """
+        self._metadata_cache.clear()
+
     async def get_workspaces(self) -> list[dict[str, Any]]:
         """Get all workspaces for the authenticated user.
 
+        Results are cached for METADATA_CACHE_TTL seconds.
+
         Returns:
             List of workspace dictionaries with 'gid' and 'name' fields
 
         Raises:
             httpx.HTTPError: If the API request fails
         """
-        logger.debug("Fetching workspaces from Asana API")
-        response = await self.client.get("/workspaces")
-        response.raise_for_status()
-        data = response.json()
-        workspaces = data.get("data", [])
-        logger.debug(f"Found {len(workspaces)} workspaces")
-        return workspaces
+
+        async def fetch() -> list[dict[str, Any]]:
+            logger.debug("Fetching workspaces from Asana API")
+            response = await self.client.get("/workspaces")
+            response.raise_for_status()
+            data = json_fast.loads(response.content)
+            workspaces = data.get("data", [])
+            logger.debug("Found %s workspaces", len(workspaces))
+            return workspaces
+
+        return await self._cached_listing("workspaces", fetch)
 
     async def get_projects(self, workspace_id: str) -> list[dict[str, Any]]:
         """Get all active (non-archived) projects in a workspace.
 
+        Results are cached for METADATA_CACHE_TTL seconds.
+
         Args:
             workspace_id: The GID of the workspace
 
@@ -54,26 +167,95 @@ class AsanaClient:
         Raises:
             httpx.HTTPError: If the API request fails
         """
-        logger.debug(f"Fetching projects for workspace {workspace_id}")
 
-        response = await self.client.get(
-            f"/workspaces/{workspace_id}/projects",
-            params={"opt_fields": "gid,name", "archived": "false", "limit": 100},
-        )
-        response.raise_for_status()
-        data = response.json()
-        projects = data.get("data", [])
+        async def fetch() -> list[dict[str, Any]]:
+            logger.debug("Fetching projects for workspace %s", workspace_id)
 
-        logger.debug(
-            f"Found {len(projects)} active projects in workspace {workspace_id}"
-        )
-        return projects
+            response = await self.client.get(
+                f"/workspaces/{workspace_id}/projects",
+                params={"opt_fields": "gid,name", "archived": "false", "limit": 100},
+            )
+            response.raise_for_status()
+            data = json_fast.loads(response.content)
+            projects = data.get("data", [])
+
+            logger.debug(
+                "Found %s active projects in workspace %s", len(projects), workspace_id
+            )
+            return projects
+
+        return await self._cached_listing(f"projects:{workspace_id}", fetch)
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Sleep until the client-wide rate-limit window (if any) has passed."""
+        loop = asyncio.get_running_loop()
+        while (delay := self._rate_limit_until - loop.time()) > 0:
+            await asyncio.sleep(delay)
+
+    async def _set_rate_limit(self, retry_after: float) -> None:
+        """Pause all requests for ``retry_after`` seconds from now.
+
+        An earlier deadline never shortens a later one already in place.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._rate_limit_lock:
+            # Jitter so waiting callers don't all resume on the same tick
+            deadline = loop.time() + retry_after + random.uniform(0, 1.0)
+            self._rate_limit_until = max(self._rate_limit_until, deadline)
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> float | None:
+        """Return the Retry-After delay in seconds, if the response has one.
+
+        Only the delay-seconds form is supported; HTTP-date values are
+        ignored. 429 responses without the header default to 60 seconds.
+        """
+        value = response.headers.get("Retry-After")
+        if value is not None:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+        if response.status_code == 429:
+            return 60.0
+        return None
+
+    @staticmethod
+    def _is_retryable(error: httpx.HTTPError, retry_safe: bool) -> bool:
+        """Decide whether a failed request may be sent again.
+
+        Client errors (4xx) are never retried: the same request would fail
+        the same way. Server errors and dropped connections are retried only
+        for retry-safe requests, because the server may already have applied
+        them. Connection failures are always retryable since nothing was sent.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return retry_safe and (status >= 500 or status == 429)
+        if isinstance(
+            error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+        ):
+            return True
+        if isinstance(error, httpx.TransportError):
+            return retry_safe
+        return False
 
     async def _make_request_with_retry(
-        self, method: str, url: str, max_retries: int = 3, **kwargs
+        self,
+        method: str,
+        url: str,
+        max_retries: int = 3,
+        **kwargs,
     ) -> dict[str, Any]:
         """Make an API request with retry logic for rate limiting and transient errors.
 
+        Idempotent methods (see IDEMPOTENT_METHODS) are retried on server
+        errors and transport failures. Other methods are retried only when
+        nothing reached the server. Client errors (4xx) fail immediately,
+        except rate-limit responses (429), which wait for Retry-After. Other
+        error responses carrying Retry-After are waited out and resent only
+        if the request is retry-safe.
+
         Args:
             method: HTTP method (GET, POST, PUT, etc.)
             url: URL path (relative to base_url)
@@ -84,39 +266,124 @@ class AsanaClient:
             JSON response data
 
         Raises:
-            httpx.HTTPError: If the request fails after all retries
+            httpx.HTTPError: If the request fails and can't be retried, or
+                fails after all retries
         """
+        retry_safe = method.upper() in IDEMPOTENT_METHODS
+
+        # Encode JSON bodies once, with orjson when available
+        if "json" in kwargs:
+            kwargs["content"] = json_fast.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Type": "application/json",
+            }
+
         for attempt in range(max_retries):
             try:
-                response = await self.client.request(method, url, **kwargs)
-
-                # Handle rate limiting (429)
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    logger.warning(
-                        f"Rate limited. Retrying after {retry_after} seconds..."
-                    )
-                    await asyncio.sleep(retry_after)
-                    continue
+                await self._wait_for_rate_limit()
+
+                # Only the request holds a slot; backoff sleeps don't
+                async with self._inflight:
+                    response = await self.client.request(method, url, **kwargs)
+
+                # Honour Retry-After (429, 503, ...); the wait happens at the top
+                # of the loop, shared by all callers. A 429 was rejected before
+                # being processed, so resending it is always safe; any other
+                # status may follow a partially applied request.
+                if response.status_code >= 400:
+                    retry_after = self._parse_retry_after(response)
+                    if (
+                        retry_after is not None
+                        and (response.status_code == 429 or retry_safe)
+                        and attempt < max_retries - 1
+                    ):
+                        logger.warning(
+                            "Rate limited (%s). Pausing requests for %.0f seconds...",
+                            response.status_code,
+                            retry_after,
+                        )
+                        await self._set_rate_limit(retry_after)
+                        continue
 
                 response.raise_for_status()
-                return response.json()
+                return json_fast.loads(response.content)
 
             except httpx.HTTPError as e:
-                if attempt == max_retries - 1:
-                    logger.error(f"Request failed after {max_retries} attempts: {e}")
+                if attempt == max_retries - 1 or not self._is_retryable(e, retry_safe):
+                    logger.error("Request failed after %s attempts: %s", attempt + 1, e)
                     raise
 
-                # Exponential backoff for transient errors
-                wait_time = 2**attempt
+                # Exponential backoff with full jitter for transient errors
+                wait_time = random.uniform(
+                    0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)
+                )
                 logger.warning(
-                    f"Request failed (attempt {attempt + 1}/{max_retries}). Retrying in {wait_time}s..."
+                    "Request failed (attempt %s/%s). Retrying in %.1fs...",
+                    attempt + 1,
+                    max_retries,
+                    wait_time,
                 )
                 await asyncio.sleep(wait_time)
 
         # This should never be reached, but just in case
         raise httpx.HTTPError("Request failed after all retries")
 
+    async def _paginate(
+        self,
+        url: str,
+        params: dict[str, Any],
+        page_size: int = 100,
+        limit: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the pages of a paginated collection endpoint.
+
+        Follows Asana's ``next_page.offset`` cursor until it runs out. The
+        request for page N+1 is started before page N is handed to the
+        caller, so processing a page overlaps with fetching the next one.
+        Once ``limit`` items have been received no further page is
+        requested, so bounded callers never pay for an unused prefetch.
+
+        Args:
+            url: URL path of the collection (relative to base_url)
+            params: Query parameters sent with every page request
+            page_size: Number of items to request per page (max 100)
+            limit: Stop after the page that brings the item count to this
+                many (None = follow the cursor to the end)
+
+        Yields:
+            Lists of item dictionaries, one list per page, in API order
+
+        Raises:
+            httpx.HTTPError: If an API request fails
+        """
+        params = {**params, "limit": page_size}
+        received = 0
+        pending = asyncio.create_task(
+            self._make_request_with_retry("GET", url, params=params)
+        )
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+                items = data.get("data", [])
+                received += len(items)
+
+                next_page = data.get("next_page") or {}
+                offset = next_page.get("offset")
+                if offset and (limit is None or received < limit):
+                    pending = asyncio.create_task(
+                        self._make_request_with_retry(
+                            "GET", url, params={**params, "offset": offset}
+                        )
+                    )
+
+                yield items
+        finally:
+            # Don't leave a prefetch running if the caller stops early
+            if pending is not None:
+                pending.cancel()
+
     async def get_project_tasks(
         self, project_id: str, limit: int | None = None
     ) -> list[dict[str, Any]]:
@@ -132,23 +399,74 @@ class AsanaClient:
         Raises:
             httpx.HTTPError: If the API request fails
         """
-        logger.debug(f"Fetching tasks for project {project_id}")
+        logger.debug("Fetching tasks for project %s", project_id)
+
+        page_size = min(limit, 100) if limit else 100
+        tasks: list[dict[str, Any]] = []
+        pages = self.iter_project_task_pages(project_id, page_size, limit)
+        try:
+            async for page in pages:
+                tasks.extend(page)
+                if limit and len(tasks) >= limit:
+                    del tasks[limit:]
+                    break
+        finally:
+            await pages.aclose()
 
-        params = {"opt_fields": "gid,name,created_at,parent,num_subtasks"}
-        if limit:
-            params["limit"] = str(limit)
+        # Sort by creation date (ascending)
+        tasks.sort(key=_BY_CREATED_AT)
 
-        data = await self._make_request_with_retry(
-            "GET", f"/projects/{project_id}/tasks", params=params
+        logger.debug("Found %s tasks in project %s", len(tasks), project_id)
+        return tasks
+
+    def iter_project_task_pages(
+        self, project_id: str, page_size: int = 100, limit: int | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the tasks of a project one API page at a time.
+
+        Args:
+            project_id: The GID of the project
+            page_size: Number of tasks to request per page (max 100)
+            limit: Stop requesting pages once this many tasks have been
+                received (None = all tasks)
+
+        Returns:
+            Async iterator over lists of task dictionaries, one list per
+            page, in API order
+
+        Raises:
+            httpx.HTTPError: If an API request fails
+        """
+        logger.debug("Streaming tasks for project %s", project_id)
+
+        return self._paginate(
+            f"/projects/{project_id}/tasks",
+            {"opt_fields": TASK_OPT_FIELDS},
+            page_size,
+            limit,
         )
 
-        tasks = data.get("data", [])
+    async def iter_project_tasks(
+        self, project_id: str, page_size: int = 100
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield all tasks in a project page by page.
 
-        # Sort by creation date (ascending)
-        tasks.sort(key=lambda t: t.get("created_at", ""))
+        Unlike get_project_tasks, tasks are yielded in API order as each page
+        arrives, so callers never hold more than one page in memory.
 
-        logger.debug(f"Found {len(tasks)} tasks in project {project_id}")
-        return tasks
+        Args:
+            project_id: The GID of the project
+            page_size: Number of tasks to request per page (max 100)
+
+        Yields:
+            Task dictionaries
+
+        Raises:
+            httpx.HTTPError: If an API request fails
+        """
+        async for page in self.iter_project_task_pages(project_id, page_size):
+            for task in page:
+                yield task
 
     async def get_task_subtasks(self, task_id: str) -> list[dict[str, Any]]:
         """Get all subtasks of a task.
@@ -162,21 +480,104 @@ class AsanaClient:
         Raises:
             httpx.HTTPError: If the API request fails
         """
-        logger.debug(f"Fetching subtasks for task {task_id}")
+        logger.debug("Fetching subtasks for task %s", task_id)
 
-        data = await self._make_request_with_retry(
-            "GET",
+        subtasks: list[dict[str, Any]] = []
+        async for page in self._paginate(
             f"/tasks/{task_id}/subtasks",
-            params={"opt_fields": "gid,name,created_at,parent"},
+            {"opt_fields": TASK_OPT_FIELDS},
+        ):
+            subtasks.extend(page)
+
+        # Sort by creation date (ascending)
+        subtasks.sort(key=_BY_CREATED_AT)
+
+        logger.debug("Found %s subtasks for task %s", len(subtasks), task_id)
+        return subtasks
+
+    async def get_project_tree(self, project_id: str) -> list[dict[str, Any]]:
+        """Get all tasks in a project together with their direct subtasks.
+
+        Subtasks are requested inline through ``subtasks.*`` opt_fields, so
+        the whole first level of the tree arrives with the task list instead
+        of one extra request per task. Tasks whose inline subtask list is
+        shorter than ``num_subtasks`` are completed with get_task_subtasks.
+
+        Args:
+            project_id: The GID of the project
+
+        Returns:
+            List of task dictionaries sorted by created_at (ascending), each
+            with a 'subtasks' list (also sorted by created_at). Subtasks
+            carry 'num_subtasks' but not their own children.
+
+        Raises:
+            httpx.HTTPError: If an API request fails
+        """
+        logger.debug("Fetching task tree for project %s", project_id)
+
+        opt_fields = ",".join(
+            TASK_FIELDS + tuple(f"subtasks.{f}" for f in TASK_FIELDS)
         )
 
-        subtasks = data.get("data", [])
+        tasks: list[dict[str, Any]] = []
+        async for page in self._paginate(
+            f"/projects/{project_id}/tasks", {"opt_fields": opt_fields}
+        ):
+            tasks.extend(page)
+
+        incomplete = [
+            t["gid"]
+            for t in tasks
+            if len(t.get("subtasks") or ()) < t.get("num_subtasks", 0)
+        ]
+        if incomplete:
+            logger.debug(
+                "Fetching subtasks separately for %s tasks in project %s",
+                len(incomplete),
+                project_id,
+            )
+            fetched = await self.get_many_subtasks(incomplete)
+        else:
+            fetched = {}
+
+        for task in tasks:
+            subtasks = fetched.get(task["gid"])
+            if subtasks is None:
+                subtasks = task.get("subtasks") or []
+                subtasks.sort(key=_BY_CREATED_AT)
+            task["subtasks"] = subtasks
 
         # Sort by creation date (ascending)
-        subtasks.sort(key=lambda t: t.get("created_at", ""))
+        tasks.sort(key=_BY_CREATED_AT)
 
-        logger.debug(f"Found {len(subtasks)} subtasks for task {task_id}")
-        return subtasks
+        logger.debug("Found %s tasks in project %s", len(tasks), project_id)
+        return tasks
+
+    async def get_many_subtasks(
+        self, task_ids: list[str], concurrency: int = 16
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get the subtasks of several tasks concurrently.
+
+        Args:
+            task_ids: GIDs of the parent tasks
+            concurrency: Maximum number of subtask fetches in flight at once
+
+        Returns:
+            Dictionary mapping each parent GID to its subtasks, sorted by
+            created_at (ascending)
+
+        Raises:
+            httpx.HTTPError: If any API request fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(task_id: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.get_task_subtasks(task_id)
+
+        results = await asyncio.gather(*(fetch(tid) for tid in task_ids))
+        return dict(zip(task_ids, results))
 
     async def update_task_name(self, task_id: str, new_name: str) -> dict[str, Any]:
         """Update the name of a task.
@@ -191,15 +592,121 @@ class AsanaClient:
         Raises:
             httpx.HTTPError: If the API request fails
         """
-        logger.debug(f"Updating task {task_id} name to: {new_name}")
+        logger.debug("Updating task %s name to: %s", task_id, new_name)
 
         data = await self._make_request_with_retry(
             "PUT", f"/tasks/{task_id}", json={"data": {"name": new_name}}
         )
 
-        logger.info(f"Successfully updated task {task_id}")
+        logger.info("Successfully updated task %s", task_id)
         return data.get("data", {})
 
+    async def batch_update_task_names(
+        self, pairs: list[tuple[str, str]]
+    ) -> list[dict[str, Any]]:
+        """Rename up to BATCH_SIZE tasks with a single batch API request.
+
+        The batch POST is not idempotent, so it is not resent after a
+        server error or a dropped connection; only rate-limit responses are
+        waited out and resent.
+
+        Args:
+            pairs: List of (task GID, new name) tuples
+
+        Returns:
+            One result per pair, in order, each with 'status_code' and 'body'
+            keys as returned by Asana's batch API
+
+        Raises:
+            ValueError: If more than BATCH_SIZE pairs are given
+            httpx.HTTPError: If the batch request itself fails
+        """
+        if len(pairs) > BATCH_SIZE:
+            raise ValueError(
+                f"Asana batch requests accept at most {BATCH_SIZE} actions, got {len(pairs)}"
+            )
+
+        logger.debug("Updating %s task names in one batch request", len(pairs))
+
+        actions = [
+            {
+                "relative_path": f"/tasks/{task_id}",
+                "method": "put",
+                "data": {"name": new_name},
+            }
+            for task_id, new_name in pairs
+        ]
+        data = await self._make_request_with_retry(
+            "POST", "/batch", json={"data": {"actions": actions}}
+        )
+
+        return data.get("data", [])
+
+    async def update_task_names(
+        self, pairs: list[tuple[str, str]], concurrency: int = 5
+    ) -> list[dict[str, Any] | Exception]:
+        """Rename any number of tasks using concurrent batch API requests.
+
+        Pairs are split into chunks of BATCH_SIZE, each sent with
+        batch_update_task_names by a fixed pool of ``concurrency`` workers,
+        so only that many coroutines exist however many tasks are renamed.
+        A chunk whose request fails does not affect the others. Actions the
+        batch reports as rate-limited or failed server-side (429, 5xx) are
+        retried one by one with update_task_name; a failed batch request
+        itself is not resent.
+
+        Args:
+            pairs: List of (task GID, new name) tuples
+            concurrency: Maximum number of batch requests in flight at once
+
+        Returns:
+            One entry per pair, in order: the batch action result (with
+            'status_code' and 'body' keys), or the exception that failed
+            the pair's batch request or individual retry
+        """
+        chunks = [pairs[i:i + BATCH_SIZE] for i in range(0, len(pairs), BATCH_SIZE)]
+        results: list[list[dict[str, Any]] | list[Exception]] = [[]] * len(chunks)
+        # Shared by all workers; each chunk is handed out exactly once
+        pending = iter(enumerate(chunks))
+
+        async def worker() -> None:
+            for index, chunk in pending:
+                try:
+                    chunk_results = await self.batch_update_task_names(chunk)
+                except Exception as e:
+                    logger.error("Failed to apply batch of %s updates: %s", len(chunk), e)
+                    results[index] = [e] * len(chunk)
+                    continue
+
+                # Each action is a PUT, so a failed one can be resent on its own
+                for i, ((task_id, new_name), action) in enumerate(
+                    zip(chunk, chunk_results)
+                ):
+                    status = action.get("status_code", 0)
+                    if status != 429 and status < 500:
+                        continue
+                    logger.warning(
+                        "Batch action for task %s failed with HTTP %s, retrying",
+                        task_id,
+                        status,
+                    )
+                    try:
+                        task = await self.update_task_name(task_id, new_name)
+                    except Exception as e:
+                        chunk_results[i] = e
+                    else:
+                        chunk_results[i] = {"status_code": 200, "body": {"data": task}}
+                results[index] = chunk_results
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(chunks)))))
+        return [result for chunk_results in results for result in chunk_results]
+
     async def close(self) -> None:
         """Close the HTTP client."""
         await self.client.aclose()
+
+    async def __aenter__(self) -> "AsanaClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -2,15 +2,92 @@
 
 import logging
 import re
-from typing import Optional, Union
+from collections import Counter
+from typing import Iterable, Optional, Union
 
 from aa.models.cache import CacheData, ProjectCache
 
+__all__ = ['IDManager', 'ID_PATTERN', 'ID_RE', 'strip_id']
+
+# Stand-in for projects without cache entries in read-only lookups; never mutated
+_EMPTY_PROJECT_CACHE = ProjectCache()
+
 logger = logging.getLogger(__name__)
 
 # Regex pattern for extracting IDs: CODE-N or CODE-N-M-...
-# Matches project code (2-5 uppercase letters) followed by dash and numbers with optional sub-levels
-ID_PATTERN = r'^([A-Z]{2,5})-(\d+(?:-\d+)*)(?:\s|$)'
+# Matches project code (2-5 uppercase letters) followed by dash and numbers with optional sub-levels.
+# ID digits are plain ASCII ([0-9]); the separator after the ID is any Unicode
+# whitespace (\s), e.g. a no-break space.
+ID_PATTERN = r'^([A-Z]{2,5})-([0-9]+(?:-[0-9]+)*)(?:\s|$)'
+ID_RE = re.compile(ID_PATTERN)
+
+# Same ID prefix as ID_PATTERN, but also consumes all whitespace after it
+_STRIP_RE = re.compile(r'^([A-Z]{2,5})-([0-9]+(?:-[0-9]+)*)(?:\s+|$)')
+
+# Per-project variants of ID_RE with the project code baked in as a literal,
+# so a single match both finds the ID and checks the code. Group 1 is the
+# full ID (e.g. "PRJ-5-2").
+_ID_RE_FOR: dict[str, re.Pattern[str]] = {}
+
+
+def _id_re_for(project_code: str) -> re.Pattern[str]:
+    """Return the compiled ID regex for a project code (cached)."""
+    pattern = _ID_RE_FOR.get(project_code)
+    if pattern is None:
+        pattern = _ID_RE_FOR[project_code] = re.compile(
+            rf'^({re.escape(project_code)}-[0-9]+(?:-[0-9]+)*)(?=\s|$)'
+        )
+    return pattern
+
+
+# Per-project patterns for root IDs only (CODE-N); group 1 is N
+_ROOT_RE_FOR: dict[str, re.Pattern[str]] = {}
+
+
+def _root_re_for(project_code: str) -> re.Pattern[str]:
+    """Return the compiled root ID regex for a project code (cached)."""
+    pattern = _ROOT_RE_FOR.get(project_code)
+    if pattern is None:
+        pattern = _ROOT_RE_FOR[project_code] = re.compile(
+            rf'^{re.escape(project_code)}-([0-9]+)$'
+        )
+    return pattern
+
+
+def _numeric_part(task_id: str, project_code: str) -> str:
+    """Return task_id without its "CODE-" prefix (unchanged if absent).
+    
+    Examples:
+        >>> _numeric_part("PRJ-5-2", "PRJ")
+        '5-2'
+    """
+    n = len(project_code)
+    if task_id.startswith(project_code) and task_id.startswith("-", n):
+        return task_id[n + 1:]
+    return task_id
+
+
+def strip_id(task_name: str) -> tuple[Optional[str], str]:
+    """Split a leading ID of any project code off a task name.
+    
+    Args:
+        task_name: The task name to strip
+        
+    Returns:
+        Tuple of (removed ID or None, remaining name)
+        
+    Examples:
+        >>> strip_id("PRJ-5 My task")
+        ('PRJ-5', 'My task')
+        >>> strip_id("AB-5-2   Subtask")
+        ('AB-5-2', 'Subtask')
+        >>> strip_id("My task")
+        (None, 'My task')
+    """
+    match = _STRIP_RE.match(task_name)
+    if not match:
+        return None, task_name
+    return f"{match.group(1)}-{match.group(2)}", task_name[match.end():]
 
 
 class IDManager:
@@ -63,16 +140,18 @@ class IDManager:
             'AB-5-2'
             >>> manager.extract_id("PROJ-5-2-1 Nested", "PROJ")
             'PROJ-5-2-1'
+            >>> manager.extract_id("PRJ-5\u00a0No-break space", "PRJ")
+            'PRJ-5'
             >>> manager.extract_id("My task", "PRJ")
             None
         """
-        match = re.match(ID_PATTERN, task_name)
-        if match and match.group(1) == project_code:
-            extracted_id = f"{match.group(1)}-{match.group(2)}"
-            logger.debug(f"Extracted ID '{extracted_id}' from task: {task_name}")
+        match = _id_re_for(project_code).match(task_name)
+        if match:
+            extracted_id = match.group(1)
+            logger.debug("Extracted ID '%s' from task: %s", extracted_id, task_name)
             return extracted_id
         
-        logger.debug(f"No ID found in task: {task_name}")
+        logger.debug("No ID found in task: %s", task_name)
         return None
     
     def has_id(self, task_name: str, project_code: str) -> bool:
@@ -92,7 +171,7 @@ class IDManager:
             >>> manager.has_id("My task", "PRJ")
             False
         """
-        return self.extract_id(task_name, project_code) is not None
+        return _id_re_for(project_code).match(task_name) is not None
     
     def generate_next_root_id(self, project_code: str) -> str:
         """Generate the next ID for a root task.
@@ -116,18 +195,15 @@ class IDManager:
             >>> manager.generate_next_root_id('NEW')
             'NEW-1'
         """
-        # Get project cache or initialize
-        if project_code not in self.cache_data.projects:
-            self.cache_data.projects[project_code] = ProjectCache()
-        
-        project_cache = self.cache_data.projects[project_code]
+        # Read-only: the project entry is created by update_cache_for_id
+        project_cache = self.cache_data.projects.get(project_code, _EMPTY_PROJECT_CACHE)
         last_root = project_cache.last_root
         
         # Generate next ID
         next_id = last_root + 1
         next_id_str = f"{project_code}-{next_id}"
         
-        logger.debug(f"Generated next root ID: {next_id_str} (previous: {last_root})")
+        logger.debug("Generated next root ID: %s (previous: %s)", next_id_str, last_root)
         return next_id_str
     
     def generate_next_subtask_id(self, parent_id: str, project_code: str) -> str:
@@ -159,13 +235,10 @@ class IDManager:
         """
         # Extract the numeric part of parent ID (remove project code prefix)
         # E.g., "PRJ-5" -> "5", "PRJ-5-2" -> "5-2"
-        parent_numeric = parent_id.replace(f"{project_code}-", "", 1)
-        
-        # Get project cache or initialize
-        if project_code not in self.cache_data.projects:
-            self.cache_data.projects[project_code] = ProjectCache()
+        parent_numeric = _numeric_part(parent_id, project_code)
         
-        project_cache = self.cache_data.projects[project_code]
+        # Read-only: the project entry is created by update_cache_for_id
+        project_cache = self.cache_data.projects.get(project_code, _EMPTY_PROJECT_CACHE)
         
         # Get last subtask counter for this parent
         last_subtask = project_cache.subtasks.get(parent_numeric, 0)
@@ -174,7 +247,10 @@ class IDManager:
         next_subtask = last_subtask + 1
         next_id_str = f"{parent_id}-{next_subtask}"
         
-        logger.debug(f"Generated next subtask ID: {next_id_str} (parent: {parent_id}, previous: {last_subtask})")
+        logger.debug(
+            "Generated next subtask ID: %s (parent: %s, previous: %s)",
+            next_id_str, parent_id, last_subtask
+        )
         return next_id_str
     
     def find_max_id(self, existing_ids: list[str], project_code: str) -> int:
@@ -206,18 +282,13 @@ class IDManager:
             logger.debug("No existing IDs provided, returning 0")
             return 0
         
-        max_id = 0
-        root_pattern = re.compile(rf'^{re.escape(project_code)}-(\d+)$')
+        root_pattern = _root_re_for(project_code)
+        max_id = max(
+            (int(m.group(1)) for m in map(root_pattern.match, existing_ids) if m),
+            default=0
+        )
         
-        for task_id in existing_ids:
-            match = root_pattern.match(task_id)
-            if match:
-                id_number = int(match.group(1))
-                if id_number > max_id:
-                    max_id = id_number
-                    logger.debug(f"Found new max root ID: {id_number}")
-        
-        logger.debug(f"Maximum root ID for {project_code}: {max_id}")
+        logger.debug("Maximum root ID for %s: %s", project_code, max_id)
         return max_id
     
     def detect_conflicts(self, existing_ids: list[str], project_code: str) -> list[str]:
@@ -249,20 +320,18 @@ class IDManager:
         project_cache = self.cache_data.projects.get(project_code)
         if not project_cache:
             # No cache exists, no conflicts possible
-            logger.debug(f"No cache for project {project_code}, no conflicts")
+            logger.debug("No cache for project %s, no conflicts", project_code)
             return conflicts
         
-        # Check for duplicate IDs
-        seen_ids = set()
-        for task_id in existing_ids:
-            if task_id in seen_ids:
+        # Check for duplicate IDs (reported once per ID, in first-seen order)
+        for task_id, count in Counter(existing_ids).items():
+            if count > 1:
                 conflict_msg = f"Duplicate ID found: {task_id}"
                 conflicts.append(conflict_msg)
                 logger.warning(conflict_msg)
-            seen_ids.add(task_id)
         
         # Check for root task IDs greater than cached last_root
-        root_pattern = re.compile(rf'^{re.escape(project_code)}-(\d+)$')
+        root_pattern = _root_re_for(project_code)
         for task_id in existing_ids:
             match = root_pattern.match(task_id)
             if match:
@@ -273,9 +342,9 @@ class IDManager:
                     logger.warning(conflict_msg)
         
         if conflicts:
-            logger.warning(f"Found {len(conflicts)} conflict(s) for project {project_code}")
+            logger.warning("Found %s conflict(s) for project %s", len(conflicts), project_code)
         else:
-            logger.debug(f"No conflicts detected for project {project_code}")
+            logger.debug("No conflicts detected for project %s", project_code)
         
         return conflicts
     
@@ -299,26 +368,62 @@ class IDManager:
             >>> manager.cache_data.projects['PRJ'].subtasks['6']
             1
         """
-        # Ensure project cache exists
-        if project_code not in self.cache_data.projects:
-            self.cache_data.projects[project_code] = ProjectCache()
+        self.bulk_update([(task_id, project_code)])
+    
+    def bulk_update(self, assignments: Iterable[tuple[str, str]]) -> None:
+        """Update cache counters for many assigned IDs at once.
         
-        project_cache = self.cache_data.projects[project_code]
+        Assignments are grouped by project first, so each project's cache is
+        looked up once. Within the batch, the highest root number and the
+        highest subtask number per parent are written, replacing the cached
+        values the same way update_cache_for_id does.
         
-        # Extract numeric part (remove project code prefix)
-        numeric_part = task_id.replace(f"{project_code}-", "", 1)
+        Args:
+            assignments: Iterable of (task ID, project code) pairs,
+                e.g. [("PRJ-6", "PRJ"), ("PRJ-5-3", "PRJ")]
+            
+        Examples:
+            >>> manager = IDManager()
+            >>> manager.bulk_update([('PRJ-1', 'PRJ'), ('PRJ-2', 'PRJ'), ('PRJ-1-1', 'PRJ')])
+            >>> manager.cache_data.projects['PRJ'].last_root
+            2
+            >>> manager.cache_data.projects['PRJ'].subtasks
+            {'1': 1}
+        """
+        roots: dict[str, int] = {}
+        subtasks: dict[str, dict[str, int]] = {}
         
-        # Check if this is a root task (no dashes in numeric part) or subtask
-        if '-' not in numeric_part:
-            # Root task: update last_root
-            root_number = int(numeric_part)
-            project_cache.last_root = root_number
-            logger.debug(f"Updated last_root for {project_code} to {root_number}")
-        else:
-            # Subtask: update subtasks counter
-            # Split to get parent and subtask number
-            parts = numeric_part.rsplit('-', 1)
-            parent_numeric = parts[0]
-            subtask_number = int(parts[1])
-            project_cache.subtasks[parent_numeric] = subtask_number
-            logger.debug(f"Updated subtask counter for {project_code}-{parent_numeric} to {subtask_number}")
+        for task_id, project_code in assignments:
+            # Extract numeric part (remove project code prefix)
+            numeric_part = _numeric_part(task_id, project_code)
+            
+            # Root task if there are no dashes in the numeric part; otherwise
+            # the last dash separates the parent from the subtask number
+            idx = numeric_part.rfind('-')
+            if idx == -1:
+                root_number = int(numeric_part)
+                if root_number > roots.get(project_code, -1):
+                    roots[project_code] = root_number
+            else:
+                parent_numeric = numeric_part[:idx]
+                subtask_number = int(numeric_part[idx + 1:])
+                counters = subtasks.setdefault(project_code, {})
+                if subtask_number > counters.get(parent_numeric, -1):
+                    counters[parent_numeric] = subtask_number
+        
+        for project_code in dict.fromkeys([*roots, *subtasks]):
+            # Ensure project cache exists
+            project_cache = self.cache_data.projects.get(project_code)
+            if project_cache is None:
+                project_cache = self.cache_data.projects[project_code] = ProjectCache()
+            
+            if project_code in roots:
+                project_cache.last_root = roots[project_code]
+                logger.debug(
+                    "Updated last_root for %s to %s", project_code, roots[project_code]
+                )
+            if project_code in subtasks:
+                project_cache.subtasks.update(subtasks[project_code])
+                logger.debug(
+                    "Updated subtask counters for %s: %s", project_code, subtasks[project_code]
+                )
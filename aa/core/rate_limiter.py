@@ -0,0 +1,65 @@
+"""Async token-bucket rate limiter for Asana API calls."""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Asana's documented limit for free workspaces (requests per minute)
+ASANA_REQUESTS_PER_MINUTE = 150
+
+
+class RateLimiter:
+    """Token bucket allowing at most ``max_rate`` acquisitions per ``time_period``.
+
+    The bucket starts full, so short bursts run without delay; callers only
+    wait once the budget for the period is used up.
+
+    Usage:
+        limiter = RateLimiter(150, 60)
+        async with limiter:
+            await client.get_project_tasks(...)
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """Initialize the rate limiter.
+
+        Args:
+            max_rate: Number of acquisitions allowed per time period
+            time_period: Length of the period in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill: float | None = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accumulated since the last refill."""
+        if self._last_refill is not None:
+            elapsed = now - self._last_refill
+            self._tokens = min(
+                self.max_rate, self._tokens + elapsed * self.max_rate / self.time_period
+            )
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                self._refill(loop.time())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) * self.time_period / self.max_rate
+                logger.debug("Rate limit budget exhausted, waiting %.2fs", wait_time)
+                await asyncio.sleep(wait_time)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
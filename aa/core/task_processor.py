@@ -2,9 +2,10 @@
 
 import asyncio
 import logging
+from operator import itemgetter
 from typing import Optional
 
-from aa.core.asana_client import AsanaClient
+from aa.core.asana_client import BATCH_SIZE, AsanaClient
 from aa.core.id_manager import IDManager
 from aa.models.task import TaskUpdate
 
@@ -41,15 +42,22 @@ class ProcessingResult:
 class TaskProcessor:
     """Processes tasks and their hierarchies for ID assignment."""
     
-    def __init__(self, asana_client: AsanaClient, id_manager: IDManager):
+    def __init__(
+        self,
+        asana_client: AsanaClient,
+        id_manager: IDManager,
+        max_concurrency: int = 15
+    ):
         """Initialize the task processor.
         
         Args:
             asana_client: Asana API client for fetching and updating tasks
             id_manager: ID manager for generating and tracking IDs
+            max_concurrency: Maximum number of task updates applied at once
         """
         self.asana = asana_client
         self.id_manager = id_manager
+        self.max_concurrency = max_concurrency
     
     async def process_project(
         self,
@@ -67,109 +75,111 @@ class TaskProcessor:
         Returns:
             ProcessingResult with details of what was processed
         """
-        logger.info(f"Processing project {project_code} (ID: {project_id})")
+        logger.info("Processing project %s (ID: %s)", project_code, project_id)
         result = ProcessingResult(project_code)
         
-        # Get all tasks in the project
-        tasks = await self.asana.get_project_tasks(project_id)
-        logger.info(f"Found {len(tasks)} tasks in project {project_code}")
-        
-        # Collect all updates first (this determines IDs sequentially)
-        all_updates = []
-        for task in tasks:
-            # Skip tasks that have a parent (they'll be processed as subtasks)
-            if task.get('parent'):
-                continue
+        # Stream the project's tasks; each page's subtask trees are fetched
+        # while the following pages are still downloading
+        root_tasks = []
+        total_tasks = 0
+        prefetches: list[asyncio.Task] = []
+        try:
+            async for page in self.asana.iter_project_task_pages(project_id):
+                total_tasks += len(page)
+                
+                # Skip tasks that have a parent (they'll be processed as subtasks)
+                page_roots = [task for task in page if not task.get('parent')]
+                root_tasks.extend(page_roots)
+                prefetches.append(asyncio.create_task(self._prefetch_tree(page_roots)))
             
-            # Process this task and its subtasks recursively
-            task_updates = await self.process_task_hierarchy(
-                task,
-                project_code,
-                parent_id=None,
-                dry_run=dry_run,
-                collect_only=True  # Don't update Asana yet
-            )
-            
-            all_updates.extend(task_updates)
+            subtasks_map: dict[str, list[dict]] = {}
+            for page_map in await asyncio.gather(*prefetches):
+                subtasks_map.update(page_map)
+        finally:
+            for prefetch in prefetches:
+                prefetch.cancel()
         
-        # Now apply all updates in parallel (unless dry-run)
-        if not dry_run and all_updates:
-            logger.info(f"Applying {len(all_updates)} updates in parallel (max 15 concurrent)...")
-            
-            # Semaphore to limit concurrent requests
-            semaphore = asyncio.Semaphore(15)
+        logger.info("Found %s tasks in project %s", total_tasks, project_code)
+        
+        # IDs follow creation order across the whole project
+        root_tasks.sort(key=itemgetter('created_at'))
+        
+        # Assign IDs in creation order (no API calls from here on)
+        all_updates = self._walk_hierarchy(
+            root_tasks, project_code, None, subtasks_map, dry_run
+        )
+        
+        # Now apply all updates through the batch API (unless dry-run)
+        if dry_run or not all_updates:
+            # Nothing to send: every planned update is reported as-is
+            result.updates = all_updates
+        else:
+            logger.info(
+                "Applying %s updates in batches of %s (max %s concurrent)...",
+                len(all_updates), BATCH_SIZE, self.max_concurrency
+            )
             
-            async def apply_update(update: TaskUpdate):
-                """Apply a single update to Asana with concurrency limit."""
-                async with semaphore:
-                    try:
-                        await self.asana.update_task_name(update.task_id, update.new_name)
-                        logger.debug(f"Successfully updated task {update.task_id}")
-                        return update
-                    except Exception as e:
-                        logger.error(f"Failed to update task {update.task_id}: {e}")
-                        raise
+            responses = await self.asana.update_task_names(
+                [(update.task_id, update.new_name) for update in all_updates],
+                concurrency=self.max_concurrency
+            )
             
-            # Apply all updates concurrently with limit
-            await asyncio.gather(*[apply_update(update) for update in all_updates])
-            logger.info(f"All {len(all_updates)} updates applied successfully")
-        
-        # Add all updates to result
-        for update in all_updates:
-            result.add_update(update)
+            # Record outcomes in the original task order
+            for update, response in zip(all_updates, responses):
+                if isinstance(response, Exception):
+                    error = str(response)
+                else:
+                    status = response.get('status_code', 0)
+                    if 200 <= status < 300:
+                        logger.debug("Successfully updated task %s", update.task_id)
+                        result.add_update(update)
+                        continue
+                    logger.error("Failed to update task %s: HTTP %s", update.task_id, status)
+                    error = f"HTTP {status}"
+                result.add_error(
+                    f"Failed to update task {update.task_id} ({update.assigned_id}): {error}"
+                )
+            logger.info(
+                "Applied %s of %s updates", len(result.updates), len(all_updates)
+            )
         
         logger.info(
-            f"Processed {result.total_processed} tasks in {project_code}: "
-            f"{len(result.updates)} updated, {result.skipped} skipped"
+            "Processed %s tasks in %s: %s updated, %s skipped",
+            result.total_processed, project_code, len(result.updates), result.skipped
         )
         
         return result
     
-    async def process_task_hierarchy(
+    def _assign_id(
         self,
         task: dict,
         project_code: str,
-        parent_id: Optional[str] = None,
-        dry_run: bool = False,
-        collect_only: bool = False
-    ) -> list[TaskUpdate]:
-        """Recursively process a task and its subtasks.
+        parent_id: Optional[str],
+        dry_run: bool
+    ) -> tuple[Optional[str], Optional[TaskUpdate]]:
+        """Determine a task's ID, allocating a new one if it has none.
+        
+        This is synchronous, so IDs are handed out strictly in call order.
         
         Args:
             task: Task dictionary from Asana API
             project_code: Project code (e.g., "PRJ")
             parent_id: Parent task's ID if this is a subtask (e.g., "PRJ-5")
-            dry_run: If True, don't actually update tasks or cache
-            collect_only: If True, only collect updates without applying them
+            dry_run: Only affects logging; the cache is updated either way
             
         Returns:
-            List of TaskUpdate objects for all processed tasks
+            Tuple of (task ID, TaskUpdate or None if the task already had an ID)
         """
-        updates = []
         task_gid = task['gid']
         task_name = task['name']
         
-        # Check if task already has an ID
-        if self.id_manager.has_id(task_name, project_code):
-            logger.debug(f"Task '{task_name}' already has ID, skipping")
+        # Check if task already has an ID (one regex match finds and extracts it)
+        existing_id = self.id_manager.extract_id(task_name, project_code)
+        if existing_id is not None:
+            logger.debug("Task '%s' already has ID, skipping", task_name)
             
-            # Extract the existing ID to use as parent for subtasks
-            existing_id = self.id_manager.extract_id(task_name, project_code)
-            
-            # Still process subtasks
-            if task.get('num_subtasks', 0) > 0:
-                subtasks = await self.asana.get_task_subtasks(task_gid)
-                for subtask in subtasks:
-                    subtask_updates = await self.process_task_hierarchy(
-                        subtask,
-                        project_code,
-                        parent_id=existing_id,
-                        dry_run=dry_run,
-                        collect_only=collect_only
-                    )
-                    updates.extend(subtask_updates)
-            
-            return updates
+            # The existing ID is used as parent for subtasks
+            return existing_id, None
         
         # Generate new ID
         if parent_id:
@@ -189,34 +199,132 @@ class TaskProcessor:
             new_name=new_name,
             assigned_id=new_id
         )
-        updates.append(update)
         
-        logger.info(f"{'[DRY-RUN] ' if dry_run else ''}Assigning ID {new_id} to task: {task_name}")
+        logger.info(
+            "%sAssigning ID %s to task: %s",
+            "[DRY-RUN] " if dry_run else "", new_id, task_name
+        )
         
         # Update cache to track ID assignment (even in dry-run for correct preview)
         self.id_manager.update_cache_for_id(new_id, project_code)
         
-        # Update task in Asana only if not collecting and not dry-run
+        return new_id, update
+    
+    async def _prefetch_tree(self, tasks: list[dict]) -> dict[str, list[dict]]:
+        """Fetch the subtasks of the given tasks and all their descendants.
+        
+        The tree is fetched breadth-first: each level's subtask requests are
+        issued together, so the number of sequential round trips equals the
+        depth of the tree rather than the number of tasks in it.
+        
+        Args:
+            tasks: Task dictionaries to start from
+            
+        Returns:
+            Dictionary mapping task GID to its subtasks (sorted by created_at);
+            tasks without subtasks are absent
+        """
+        subtasks_map: dict[str, list[dict]] = {}
+        frontier = [task['gid'] for task in tasks if task.get('num_subtasks', 0) > 0]
+        
+        while frontier:
+            logger.debug("Fetching subtasks for %s tasks", len(frontier))
+            fetched = await self.asana.get_many_subtasks(
+                frontier, concurrency=self.max_concurrency
+            )
+            subtasks_map.update(fetched)
+            frontier = [
+                subtask['gid']
+                for subtasks in fetched.values()
+                for subtask in subtasks
+                if subtask.get('num_subtasks', 0) > 0
+            ]
+        
+        return subtasks_map
+    
+    def _walk_hierarchy(
+        self,
+        tasks: list[dict],
+        project_code: str,
+        parent_id: Optional[str],
+        subtasks_map: dict[str, list[dict]],
+        dry_run: bool
+    ) -> list[TaskUpdate]:
+        """Assign IDs to tasks and their prefetched subtasks, depth-first.
+        
+        Uses an explicit stack rather than recursion, so deep trees cost no
+        extra call frames. Tasks are visited in pre-order: each task before
+        its subtasks, siblings in list order. Subtasks that already have an
+        ID and no subtasks of their own produce no updates and are skipped.
+        
+        Args:
+            tasks: Sibling task dictionaries from Asana API
+            project_code: Project code (e.g., "PRJ")
+            parent_id: Parent task's ID if these are subtasks (e.g., "PRJ-5")
+            subtasks_map: Subtasks by parent GID, as built by _prefetch_tree
+            dry_run: Only affects logging; the cache is updated either way
+            
+        Returns:
+            List of TaskUpdate objects for the tasks and their subtrees
+        """
+        updates = []
+        stack = [(task, parent_id) for task in reversed(tasks)]
+        has_id = self.id_manager.has_id
+        
+        while stack:
+            task, task_parent_id = stack.pop()
+            task_id, update = self._assign_id(task, project_code, task_parent_id, dry_run)
+            if update is not None:
+                updates.append(update)
+            
+            subtasks = subtasks_map.get(task['gid'])
+            if subtasks:
+                stack.extend(
+                    (subtask, task_id)
+                    for subtask in reversed(subtasks)
+                    if subtask.get('num_subtasks', 0) > 0
+                    or not has_id(subtask['name'], project_code)
+                )
+        
+        return updates
+    
+    async def process_task_hierarchy(
+        self,
+        task: dict,
+        project_code: str,
+        parent_id: Optional[str] = None,
+        dry_run: bool = False,
+        collect_only: bool = False
+    ) -> list[TaskUpdate]:
+        """Process a task and its subtasks.
+        
+        The subtask tree is prefetched first; IDs are then assigned without
+        further API calls.
+        
+        Args:
+            task: Task dictionary from Asana API
+            project_code: Project code (e.g., "PRJ")
+            parent_id: Parent task's ID if this is a subtask (e.g., "PRJ-5")
+            dry_run: If True, don't actually update tasks or cache
+            collect_only: If True, only collect updates without applying them
+            
+        Returns:
+            List of TaskUpdate objects for all processed tasks
+        """
+        subtasks_map = await self._prefetch_tree([task])
+        updates = self._walk_hierarchy(
+            [task], project_code, parent_id, subtasks_map, dry_run
+        )
+        
+        # Update tasks in Asana only if not collecting and not dry-run
         # When collect_only=True, updates will be applied in batch later
         if not dry_run and not collect_only:
-            try:
-                await self.asana.update_task_name(task_gid, new_name)
-                logger.debug(f"Successfully updated task {task_gid}")
-            except Exception as e:
-                logger.error(f"Failed to update task {task_gid}: {e}")
-                raise
-        
-        # Process subtasks recursively
-        if task.get('num_subtasks', 0) > 0:
-            subtasks = await self.asana.get_task_subtasks(task_gid)
-            for subtask in subtasks:
-                subtask_updates = await self.process_task_hierarchy(
-                    subtask,
-                    project_code,
-                    parent_id=new_id,
-                    dry_run=dry_run,
-                    collect_only=collect_only
-                )
-                updates.extend(subtask_updates)
+            for update in updates:
+                try:
+                    await self.asana.update_task_name(update.task_id, update.new_name)
+                    logger.debug("Successfully updated task %s", update.task_id)
+                except Exception as e:
+                    logger.error("Failed to update task %s: %s", update.task_id, e)
+                    raise
         
         return updates
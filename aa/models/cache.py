@@ -1,5 +1,7 @@
 """Cache models with Pydantic validation."""
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -13,6 +15,11 @@ class ProjectCache(BaseModel):
         subtasks: Mapping of parent ID (without project code) to last subtask number
                   Example: {"5": 3} means PRJ-5-3 was the last subtask of PRJ-5
                           {"12-2": 4} means PRJ-12-2-4 was the last subtask of PRJ-12-2
+    
+    Subtask keys are kept as the numeric part of the parent ID string. That
+    is exactly how they appear in the JSON cache file, and IDManager gets
+    the key by slicing the project prefix off the parent ID, so a lookup
+    needs no parsing or conversion.
     """
     last_root: int = Field(default=0, ge=0)
     subtasks: dict[str, int] = Field(default_factory=dict)
@@ -54,3 +61,44 @@ class CacheData(BaseModel):
     model_config = {
         'frozen': False,
     }
+
+
+_CACHE_VALIDATOR = CacheData.__pydantic_validator__
+
+
+def validate_cache(data: Any, strict: bool = False) -> CacheData:
+    """Validate raw cache data into a CacheData.
+
+    Equivalent to ``CacheData.model_validate(data, strict=strict)`` but calls
+    the compiled validator directly.
+
+    Args:
+        data: Parsed cache file contents
+        strict: Reject values that would need coercion (e.g. ``"5"`` for an int)
+
+    Returns:
+        Validated CacheData object
+
+    Raises:
+        pydantic.ValidationError: If the data has an invalid structure
+    """
+    return _CACHE_VALIDATOR.validate_python(data, strict=strict)
+
+
+def construct_cache(data: dict[str, Any]) -> CacheData:
+    """Build a CacheData from data known to be valid, skipping validation.
+
+    Only use this for data that has passed validate_cache in strict mode
+    before (e.g. an unchanged cache file); lax validation may have coerced
+    values that would be kept as-is here.
+
+    Args:
+        data: Parsed cache file contents
+
+    Returns:
+        CacheData object
+    """
+    return CacheData.model_construct(projects={
+        code: ProjectCache.model_construct(**project)
+        for code, project in data.get('projects', {}).items()
+    })
@@ -1,5 +1,8 @@
 """Configuration models with Pydantic validation."""
 
+from functools import cached_property
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -26,12 +29,41 @@ class Config(BaseModel):
         asana_token: Asana Personal Access Token
         interactive: Whether to use interactive mode (deprecated, kept for compatibility)
         projects: List of project configurations
+        max_concurrency: Maximum number of concurrent Asana requests
     """
     asana_token: str = Field(..., min_length=1)
     interactive: bool = Field(default=False)
     projects: list[ProjectConfig] = Field(..., min_items=1)
+    max_concurrency: int = Field(default=8, ge=1)
     
     model_config = {
         'frozen': False,
         'str_strip_whitespace': True,
     }
+    
+    @cached_property
+    def projects_by_code(self) -> dict[str, ProjectConfig]:
+        """Projects keyed by project code, built on first access."""
+        return {project.code: project for project in self.projects}
+
+
+# Pydantic's compiled core validator, resolved once at import time
+_CONFIG_VALIDATOR = Config.__pydantic_validator__
+
+
+def validate_config(data: Any) -> Config:
+    """Validate raw configuration data into a Config.
+
+    Equivalent to ``Config.model_validate(data)`` but calls the compiled
+    validator directly.
+
+    Args:
+        data: Parsed configuration (usually a dict loaded from YAML)
+
+    Returns:
+        Validated Config object
+
+    Raises:
+        pydantic.ValidationError: If the data does not match the schema
+    """
+    return _CONFIG_VALIDATOR.validate_python(data)
@@ -1,5 +1,6 @@
-"""Pydantic models for Asana tasks."""
+"""Models for Asana tasks."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -13,10 +14,21 @@ class AsanaTask(BaseModel):
     parent: dict | None = Field(None, description="Parent task if this is a subtask")
 
 
-class TaskUpdate(BaseModel):
-    """Model for a task update operation."""
+@dataclass(slots=True)
+class TaskUpdate:
+    """A task update operation.
     
-    task_id: str = Field(..., description="GID of the task being updated")
-    old_name: str = Field(..., description="Original task name")
-    new_name: str = Field(..., description="New task name with ID")
-    assigned_id: str = Field(..., description="The ID that was assigned (e.g., PRJ-5)")
+    A plain slotted dataclass rather than a pydantic model: one is created
+    per renamed task from values that are already known to be valid.
+    
+    Attributes:
+        task_id: GID of the task being updated
+        old_name: Original task name
+        new_name: New task name with ID
+        assigned_id: The ID that was assigned (e.g., PRJ-5)
+    """
+    
+    task_id: str
+    old_name: str
+    new_name: str
+    assigned_id: str
@@ -1,5 +1,18 @@
 """Utility modules for aa tool."""
 
-from aa.utils.config_loader import load_config, ConfigurationError
+import importlib
 
 __all__ = ['load_config', 'ConfigurationError']
+
+# Re-exports are resolved on first access so that importing a light submodule
+# (e.g. aa.utils.cache_manager) does not pull in PyYAML via the config loader.
+_LAZY_EXPORTS = {
+    'load_config': 'aa.utils.config_loader',
+    'ConfigurationError': 'aa.utils.config_loader',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,74 +1,183 @@
 """Cache management utilities."""
 
+import hashlib
 import logging
 from pathlib import Path
-from typing import Optional
 
-import yaml
 from pydantic import ValidationError
 
-from aa.models.cache import CacheData, ProjectCache
+from aa.models.cache import CacheData, construct_cache, validate_cache
+from aa.utils import json_fast
+from aa.utils.user_cache import user_cache_dir
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_CACHE_FILE = ".aa.cache.yaml"
+DEFAULT_CACHE_FILE = ".aa.cache.json"
+
+# Cache file written by versions before the JSON format; read while no JSON
+# cache exists and replaced by one on the next save
+LEGACY_CACHE_FILE = ".aa.cache.yaml"
+
+
+# Part of the validation fingerprint; bump when CacheData's validation rules
+# change so files validated by an older version are checked again
+_CACHE_SCHEMA_VERSION = b"1"
+
+
+def _validated_marker(cache_file: Path) -> Path:
+    """Return where the fingerprint of the last validated cache file is kept."""
+    key = hashlib.blake2b(
+        str(cache_file.resolve()).encode('utf-8'), digest_size=16
+    ).hexdigest()
+    return user_cache_dir('validated', key)
+
+
+def _fingerprint(raw: bytes) -> bytes:
+    """Hash cache file contents together with the schema version."""
+    return hashlib.blake2b(raw + _CACHE_SCHEMA_VERSION, digest_size=16).digest()
+
+
+def _parse_json_cache(cache_file: Path, raw: bytes) -> CacheData:
+    """Parse and validate a JSON cache, trusting contents validated before.
+    
+    Full validation runs only when the file differs from the last version
+    that passed strict validation; the fingerprint of that version is kept in the per-user
+    cache directory. Problems with the marker are never fatal.
+    """
+    data = json_fast.loads(raw)
+    fingerprint = _fingerprint(raw)
+    marker = _validated_marker(cache_file)
+    
+    try:
+        if marker.read_bytes() == fingerprint:
+            logger.debug(f"Cache file {cache_file} unchanged since last validation")
+            return construct_cache(data)
+    except Exception:
+        pass
+    
+    try:
+        cache = validate_cache(data, strict=True)
+    except ValidationError:
+        # Values pydantic had to coerce would be kept raw by construct_cache,
+        # so only data that is valid as written earns a marker.
+        return validate_cache(data)
+    
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_bytes(fingerprint)
+    except Exception as e:
+        logger.debug(f"Could not record validation of {cache_file}: {e}")
+    return cache
+
+
+def _read_legacy_yaml(cache_file: Path) -> object:
+    """Parse a legacy YAML cache file, logging any failure.
+    
+    PyYAML is imported here so that JSON caches never load it.
+    
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file has invalid YAML syntax
+    """
+    import yaml
+    
+    from aa.utils import yaml_fast
+    
+    try:
+        return yaml_fast.load_file(cache_file)
+    except yaml.YAMLError as e:
+        logger.error(f"Invalid YAML in cache file {cache_file}: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Error loading cache from {cache_file}: {e}")
+        raise
+
+
+def resolve_cache_path(cache_path: str = DEFAULT_CACHE_FILE) -> Path:
+    """Return the cache file to read, falling back to the legacy YAML cache.
+    
+    Args:
+        cache_path: Path to cache file (default: .aa.cache.json)
+        
+    Returns:
+        The given path, or the legacy .aa.cache.yaml path if the default
+        JSON cache does not exist yet but a legacy cache does
+    """
+    cache_file = Path(cache_path)
+    if not cache_file.exists() and cache_path == DEFAULT_CACHE_FILE:
+        legacy_file = Path(LEGACY_CACHE_FILE)
+        if legacy_file.exists():
+            return legacy_file
+    return cache_file
 
 
 def load_cache(cache_path: str = DEFAULT_CACHE_FILE) -> CacheData:
-    """Load cache data from YAML file.
+    """Load cache data from JSON file.
     
     If the cache file doesn't exist, returns an empty cache structure.
-    If the file exists but is invalid, raises an error.
+    If the file exists but is invalid, raises an error. A legacy
+    .aa.cache.yaml is read when no JSON cache exists yet; nothing is
+    written here, so the next save_cache creates .aa.cache.json.
     
     Args:
-        cache_path: Path to cache file (default: .aa.cache.yaml)
+        cache_path: Path to cache file (default: .aa.cache.json)
         
     Returns:
         CacheData object with loaded cache information
         
     Raises:
         ValidationError: If cache file has invalid structure
-        yaml.YAMLError: If cache file has invalid YAML syntax
+        ValueError: If cache file has invalid JSON syntax
+        yaml.YAMLError: If a legacy YAML cache file has invalid syntax
     """
-    cache_file = Path(cache_path)
+    cache_file = resolve_cache_path(cache_path)
     
     if not cache_file.exists():
         logger.info(f"Cache file not found at {cache_path}, starting with empty cache")
         return CacheData()
     
+    legacy = cache_file.suffix in ('.yaml', '.yml')
+    if legacy:
+        logger.info(f"Reading legacy YAML cache {cache_file}")
+        data = _read_legacy_yaml(cache_file)
+    
     try:
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        if legacy:
+            cache = validate_cache(data) if data is not None else None
+        else:
+            raw = cache_file.read_bytes()
+            cache = _parse_json_cache(cache_file, raw) if raw.strip() else None
         
-        if data is None:
-            logger.info(f"Cache file {cache_path} is empty, starting with empty cache")
+        if cache is None:
+            logger.info(f"Cache file {cache_file} is empty, starting with empty cache")
             return CacheData()
         
-        cache = CacheData(**data)
-        logger.info(f"Loaded cache from {cache_path}")
+        logger.info(f"Loaded cache from {cache_file}")
         logger.debug(f"Cache contains {len(cache.projects)} project(s)")
         return cache
         
     except ValidationError as e:
-        logger.error(f"Invalid cache structure in {cache_path}: {e}")
+        logger.error(f"Invalid cache structure in {cache_file}: {e}")
         raise
-    except yaml.YAMLError as e:
-        logger.error(f"Invalid YAML in cache file {cache_path}: {e}")
+    except ValueError as e:
+        logger.error(f"Invalid JSON in cache file {cache_file}: {e}")
         raise
     except Exception as e:
-        logger.error(f"Error loading cache from {cache_path}: {e}")
+        logger.error(f"Error loading cache from {cache_file}: {e}")
         raise
 
 
 def save_cache(cache: CacheData, cache_path: str = DEFAULT_CACHE_FILE) -> None:
-    """Save cache data to YAML file.
+    """Save cache data to JSON file.
     
-    Converts the CacheData object to a dictionary and saves it as YAML.
-    Creates the file if it doesn't exist.
+    Converts the CacheData object to a dictionary and saves it as JSON.
+    Creates the file if it doesn't exist. The file is left untouched when
+    its contents would not change; otherwise it is replaced atomically, so
+    an interrupted save never leaves a truncated cache behind.
     
     Args:
         cache: CacheData object to save
-        cache_path: Path to cache file (default: .aa.cache.yaml)
+        cache_path: Path to cache file (default: .aa.cache.json)
         
     Raises:
         IOError: If unable to write to cache file
@@ -76,12 +185,31 @@ def save_cache(cache: CacheData, cache_path: str = DEFAULT_CACHE_FILE) -> None:
     try:
         cache_file = Path(cache_path)
         
-        # Convert Pydantic model to dict
-        data = cache.model_dump()
+        # Build the dict directly; the shape is fixed and model_dump() would
+        # walk every subtask entry for nothing
+        data = {
+            'projects': {
+                code: {
+                    'last_root': project_cache.last_root,
+                    'subtasks': project_cache.subtasks,
+                }
+                for code, project_cache in cache.projects.items()
+            }
+        }
+        
+        payload = json_fast.dumps(data, indent=True) + b'\n'
+        try:
+            unchanged = cache_file.read_bytes() == payload
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            logger.debug(f"Cache {cache_path} is unchanged, not rewriting")
+            return
         
-        # Write to YAML file
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        # Write next to the target and rename over it
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        tmp_file.write_bytes(payload)
+        tmp_file.replace(cache_file)
         
         logger.info(f"Saved cache to {cache_path}")
         logger.debug(f"Cache contains {len(cache.projects)} project(s)")
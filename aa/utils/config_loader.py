@@ -2,12 +2,12 @@
 
 import logging
 from pathlib import Path
-from typing import Any
 
 import yaml
 from pydantic import ValidationError
 
-from aa.models.config import Config
+from aa.models.config import Config, validate_config
+from aa.utils.yaml_fast import load_file
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +40,7 @@ def load_config(config_path: str = '.aa.yml') -> Config:
     
     # Load YAML
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = load_file(path)
     except yaml.YAMLError as e:
         raise ConfigurationError(
             f"Invalid YAML in configuration file: {config_path}\n"
@@ -55,7 +54,7 @@ def load_config(config_path: str = '.aa.yml') -> Config:
     
     # Validate with Pydantic
     try:
-        config = Config(**data)
+        config = validate_config(data)
         logger.debug(f"Successfully loaded config from {config_path}")
         logger.debug(f"Found {len(config.projects)} project(s)")
         return config
@@ -0,0 +1,57 @@
+"""Interrupt handling that saves the ID cache before exiting."""
+
+import logging
+import signal
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import click
+
+from aa.models.cache import CacheData
+from aa.utils.cache_manager import save_cache
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def install_cache_saver(
+    get_cache: Callable[[], Optional[CacheData]],
+    silent: bool = False
+) -> Iterator[None]:
+    """Save the cache on SIGINT/SIGTERM while the context is active.
+
+    The cache to save is looked up through ``get_cache`` when the signal
+    arrives, so the handler always sees the caller's current state. After
+    saving, KeyboardInterrupt is raised. Previous handlers are restored on
+    exit.
+
+    Args:
+        get_cache: Returns the cache to save, or None to skip saving
+            (e.g. in dry-run mode)
+        silent: If True, don't print the confirmation message
+
+    Usage:
+        with install_cache_saver(lambda: id_manager.cache_data):
+            ...
+    """
+    def signal_handler(signum, frame):
+        logger.warning("\nReceived interrupt signal, saving cache...")
+        cache = get_cache()
+        if cache is not None:
+            try:
+                save_cache(cache)
+                if not silent:
+                    click.echo("\n✓ Cache saved before exit")
+            except Exception as e:
+                logger.error(f"Failed to save cache on interrupt: {e}")
+        raise KeyboardInterrupt()
+
+    previous = {
+        sig: signal.signal(sig, signal_handler)
+        for sig in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        yield
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
@@ -0,0 +1,79 @@
+"""JSON helpers that prefer orjson when available."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON document as a string or bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON.
+
+    Args:
+        data: Python object to serialize
+        indent: If True, pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False
+    ).encode('utf-8')
+
+
+def load_file(path: str | Path) -> Any:
+    """Parse a JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(data: Any, path: str | Path, indent: bool = True) -> None:
+    """Write data to a JSON file.
+
+    Args:
+        data: Python object to serialize
+        path: Path to the JSON file
+        indent: If True, pretty-print with two-space indentation
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    payload = dumps(data, indent=indent)
+    if not payload.endswith(b'\n'):
+        payload += b'\n'
+    with open(path, 'wb') as f:
+        f.write(payload)
@@ -0,0 +1,39 @@
+"""Event loop runner shared by the CLI commands."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (not available on Windows)
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop whose tasks start eagerly.
+
+    Uses uvloop's libuv-based loop when it is installed, otherwise the
+    standard asyncio loop. With ``asyncio.eager_task_factory`` a new task
+    runs synchronously until its first real suspension, so tasks that
+    finish without blocking (cache hits, dry-run paths, already-completed
+    futures) never go through the scheduler.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Drop-in replacement for ``asyncio.run`` used by all commands.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run(main, loop_factory=_new_event_loop)
@@ -0,0 +1,20 @@
+"""Helpers for the per-user cache directory (~/.cache/aa)."""
+
+import os
+from pathlib import Path
+
+
+def user_cache_dir(*parts: str) -> Path:
+    """Return a path inside the per-user aa cache directory.
+
+    Honors ``XDG_CACHE_HOME`` and falls back to ``~/.cache``. The directory
+    is not created.
+
+    Args:
+        *parts: Optional sub-path components
+
+    Returns:
+        Path to the requested cache location
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base, 'aa', *parts)
@@ -0,0 +1,54 @@
+"""YAML helpers that prefer the libyaml C bindings when available."""
+
+from pathlib import Path
+from typing import Any, IO
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+def safe_load(stream: str | bytes | IO) -> Any:
+    """Parse YAML like ``yaml.safe_load`` using the fastest safe loader.
+
+    Args:
+        stream: YAML document as a string, bytes or open file
+
+    Returns:
+        Parsed Python object
+    """
+    return yaml.load(stream, Loader=_Loader)
+
+
+def safe_dump(data: Any, stream: IO | None = None, **kwargs) -> str | None:
+    """Serialize data like ``yaml.safe_dump`` using the fastest safe dumper.
+
+    Args:
+        data: Python object to serialize
+        stream: Optional file to write to; if omitted the YAML is returned
+        **kwargs: Additional arguments passed to ``yaml.dump``
+
+    Returns:
+        YAML string if no stream was given, otherwise None
+    """
+    return yaml.dump(data, stream, Dumper=_Dumper, **kwargs)
+
+
+def load_file(path: str | Path) -> Any:
+    """Parse a YAML file with the fastest safe loader.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file has invalid YAML syntax
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return safe_load(f)
@@ -1,5 +1,8 @@
 """Прототип функции форматирования деталей обновлений."""
 
+from itertools import islice
+from typing import Callable
+
 from aa.models.task import TaskUpdate
 
 
@@ -17,22 +20,96 @@ def format_update_details(updates: list[TaskUpdate], limit: int | None = None) -
     if not updates:
         return ""
 
-    lines = []
+    # Без лимита не нужны ни срез, ни строка "... and N more"
+    if limit is None:
+        return _format_update_details_all(updates)
+    # Отрицательный лимит считаем нулевым (islice его не принимает)
+    return _format_update_details_limited(updates, max(limit, 0))
+
+
+def _format_update_details_all(updates: list[TaskUpdate]) -> str:
+    """Полный формат для всех обновлений (непустой список, без лимита)."""
+    # Блоки разделяются пустой строкой, перед первым - перевод строки
+    return "\n" + "\n\n".join([
+        f"  {update.assigned_id}: {update.new_name}\n    Was: {update.old_name}"
+        for update in updates
+    ])
 
-    # Определяем количество обновлений для показа
-    display_count = len(updates) if limit is None else min(limit, len(updates))
 
-    # Форматируем каждое обновление
-    for update in updates[:display_count]:
-        lines.append(f"\n  {update.assigned_id}: {update.new_name}")
-        lines.append(f"    Was: {update.old_name}")
+def _format_update_details_limited(updates: list[TaskUpdate], limit: int) -> str:
+    """Полный формат для первых limit обновлений (непустой список)."""
+    blocks = [
+        f"  {update.assigned_id}: {update.new_name}\n    Was: {update.old_name}"
+        for update in islice(updates, limit)
+    ]
 
     # Если есть еще обновления, которые не показываем
-    if limit and len(updates) > limit:
+    total = len(updates)
+    if limit and total > limit:
+        remaining = total - limit
+        blocks.append(f"  ... and {remaining} more task(s)")
+
+    # Блоки разделяются пустой строкой, перед первым - перевод строки
+    return "\n" + "\n\n".join(blocks) if blocks else ""
+
+
+def make_update_details_formatter(
+    limit: int | None,
+) -> Callable[[list[TaskUpdate]], str]:
+    """
+    Создает format_update_details с заранее зафиксированным лимитом.
+
+    Все, что зависит только от лимита, вычисляется один раз при создании:
+    возвращаемая функция не проверяет лимит и не сравнивает его с нулем,
+    а в строке "... and N more task(s)" подставляется только N.
+
+    Args:
+        limit: Максимальное количество обновлений для показа (None = все)
+
+    Returns:
+        Функция, принимающая список обновлений и возвращающая строку
+
+    Raises:
+        ValueError: Если лимит отрицательный
+
+    Examples:
+        format_first_ten = make_update_details_formatter(10)
+        print(format_first_ten(result.updates))
+    """
+    if limit is None:
+        def format_all(updates: list[TaskUpdate]) -> str:
+            if not updates:
+                return ""
+            return "\n" + "\n\n".join([
+                f"  {update.assigned_id}: {update.new_name}\n    Was: {update.old_name}"
+                for update in updates
+            ])
+
+        return format_all
+
+    if limit < 0:
+        raise ValueError(f"limit must be non-negative, got {limit}")
+
+    if limit == 0:
+        # Как и format_update_details(updates, 0): ничего не показываем
+        def format_nothing(updates: list[TaskUpdate]) -> str:
+            return ""
+
+        return format_nothing
+
+    def format_limited(updates: list[TaskUpdate]) -> str:
+        if not updates:
+            return ""
+        text = "\n" + "\n\n".join([
+            f"  {update.assigned_id}: {update.new_name}\n    Was: {update.old_name}"
+            for update in islice(updates, limit)
+        ])
         remaining = len(updates) - limit
-        lines.append(f"\n  ... and {remaining} more task(s)")
+        if remaining > 0:
+            return f"{text}\n\n  ... and {remaining} more task(s)"
+        return text
 
-    return "\n".join(lines)
+    return format_limited
 
 
 def format_update_details_compact(
@@ -51,20 +128,26 @@ def format_update_details_compact(
     if not updates:
         return ""
 
-    lines = []
-
-    # Определяем количество обновлений для показа
-    display_count = len(updates) if limit is None else min(limit, len(updates))
-
-    # Форматируем каждое обновление
-    for update in updates[:display_count]:
-        # Показываем только если название изменилось
-        if update.old_name != update.new_name:
-            lines.append(f"    {update.assigned_id}: {update.old_name}")
+    total = len(updates)
+
+    # Определяем обновления для показа (без лимита - весь список как есть).
+    # Отрицательный лимит считаем нулевым (islice его не принимает)
+    if limit is None:
+        shown = updates
+    else:
+        limit = max(limit, 0)
+        shown = islice(updates, limit)
+
+    # Форматируем каждое обновление, только если название изменилось
+    lines = [
+        f"    {update.assigned_id}: {update.old_name}"
+        for update in shown
+        if update.old_name != update.new_name
+    ]
 
     # Если есть еще обновления, которые не показываем
-    if limit and len(updates) > limit:
-        remaining = len(updates) - limit
+    if limit and total > limit:
+        remaining = total - limit
         lines.append(f"    ... and {remaining} more")
 
     return "\n".join(lines)
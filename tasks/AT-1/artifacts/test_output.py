@@ -6,6 +6,7 @@ from contextlib import redirect_stdout
 
 from aa.models.task import TaskUpdate
 from aa.core.task_processor import ProcessingResult
+from format_prototype import format_update_details_compact
 
 
 def test_output_formatting():
@@ -34,33 +35,23 @@ def test_output_formatting():
     print(f"  Tasks updated: {len(result.updates)}")
     print(f"  Tasks skipped (already have ID): {result.skipped}")
 
+    # Первые 10 обновлений выводятся и по умолчанию, и в dry-run режиме
+    first_ten = format_update_details_compact(result.updates, limit=10)
+    if len(result.updates) > 10:
+        # Строка "... and N more" идет последней, дописываем к ней подсказку
+        first_ten += " (use -v to see all)"
+
     print("\n=== Тест 2: Первые 10 обновлений (по умолчанию) ===")
     print("  Updated tasks:")
-    verbose = False
-    display_count = min(10, len(result.updates)) if not verbose else len(result.updates)
-    for update in result.updates[:display_count]:
-        print(f"    {update.assigned_id}: {update.old_name}")
-    if len(result.updates) > display_count:
-        remaining = len(result.updates) - display_count
-        print(f"    ... and {remaining} more (use -v to see all)")
+    print(first_ten)
 
     print("\n=== Тест 3: Все обновления (verbose=True) ===")
     print("  Updated tasks:")
-    verbose = True
-    display_count = min(10, len(result.updates)) if not verbose else len(result.updates)
-    for update in result.updates[:display_count]:
-        print(f"    {update.assigned_id}: {update.old_name}")
-    if len(result.updates) > display_count:
-        remaining = len(result.updates) - display_count
-        print(f"    ... and {remaining} more (use -v to see all)")
+    print(format_update_details_compact(result.updates))
 
     print("\n=== Тест 4: Dry-run режим ===")
     print("  IDs that would be assigned:")
-    for update in result.updates[:10]:
-        print(f"    {update.assigned_id}: {update.old_name}")
-    if len(result.updates) > 10:
-        remaining = len(result.updates) - 10
-        print(f"    ... and {remaining} more (use -v to see all)")
+    print(first_ten)
 
     print("\n=== Тест 5: Пустой результат ===")
     empty_result = ProcessingResult("TEST")
@@ -71,8 +62,7 @@ def test_output_formatting():
 
     if empty_result.updates:
         print("  Updated tasks:")
-        for update in empty_result.updates[:10]:
-            print(f"    {update.assigned_id}: {update.old_name}")
+        print(format_update_details_compact(empty_result.updates, limit=10))
     else:
         print("  (no updates)")
 